@@ -18,6 +18,7 @@ SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_KEY")
 
 # DataLabs Configuration
 DATALABS_API_KEY = os.getenv("DATALABS_API_KEY")
+DATALABS_SAVE_OUTPUTS = os.getenv("DATALABS_SAVE_OUTPUTS", "false").lower() in ("1", "true", "yes")
 
 # n8n Configuration
 N8N_WEBHOOK_URL = os.getenv("N8N_WEBHOOK_URL")
@@ -70,6 +71,7 @@ class Settings:
     
     # DataLabs
     DATALABS_API_KEY = DATALABS_API_KEY
+    DATALABS_SAVE_OUTPUTS = DATALABS_SAVE_OUTPUTS
     
     # n8n
     N8N_WEBHOOK_URL = N8N_WEBHOOK_URL
@@ -129,7 +129,9 @@ class BatchProcessor:
     
     def _group_by_processor_type(self, documents_with_metadata: List[Dict]) -> Dict[str, List[Dict]]:
         """Group documents by their processor type for optimal scheduling"""
-        from processors.processor_factory import processor_factory
+        from processors.processor_factory import get_processor_factory
+        
+        processor_factory = get_processor_factory()
         
         groups = {}
         for item in documents_with_metadata:
@@ -83,28 +83,46 @@ class CircuitBreaker:
             CircuitBreakerOpenException: When circuit is open
             Original exception: When function fails
         """
-        with self.lock:
-            self.stats.total_requests += 1
+        self._before_call()
+        
+        # Execute the function
+        try:
+            start_time = time.time()
+            result = func(*args, **kwargs)
+            execution_time = time.time() - start_time
             
-            # Check if circuit should be opened
-            if self.state == CircuitState.CLOSED:
-                if self.stats.current_consecutive_failures >= self.config.failure_threshold:
-                    self._open_circuit()
+            self._record_success(execution_time)
+            return result
             
-            # Check if circuit should move to half-open
-            elif self.state == CircuitState.OPEN:
-                if self._should_attempt_reset():
-                    self._half_open_circuit()
+        except self.config.expected_exceptions as e:
+            self._record_failure(e)
+            raise
+        except Exception as e:
+            # Unexpected exceptions don't count as circuit breaker failures
+            self.logger.warning(f"Unexpected exception in circuit breaker '{self.name}': {e}")
+            raise
+    
+    async def call_async(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Await a coroutine function with circuit breaker protection.
+        
+        Args:
+            func: Coroutine function to execute
+            *args: Function arguments
+            **kwargs: Function keyword arguments
             
-            # Block requests when circuit is open
-            if self.state == CircuitState.OPEN:
-                self.logger.warning(f"Circuit breaker '{self.name}' is OPEN, blocking request")
-                raise CircuitBreakerOpenException(f"Circuit breaker '{self.name}' is open")
+        Returns:
+            Function result
+            
+        Raises:
+            CircuitBreakerOpenException: When circuit is open
+            Original exception: When function fails
+        """
+        self._before_call()
         
-        # Execute the function
         try:
             start_time = time.time()
-            result = func(*args, **kwargs)
+            result = await func(*args, **kwargs)
             execution_time = time.time() - start_time
             
             self._record_success(execution_time)
@@ -118,6 +136,26 @@ class CircuitBreaker:
             self.logger.warning(f"Unexpected exception in circuit breaker '{self.name}': {e}")
             raise
     
+    def _before_call(self):
+        """Count the request and block it if the circuit is open"""
+        with self.lock:
+            self.stats.total_requests += 1
+            
+            # Check if circuit should be opened
+            if self.state == CircuitState.CLOSED:
+                if self.stats.current_consecutive_failures >= self.config.failure_threshold:
+                    self._open_circuit()
+            
+            # Check if circuit should move to half-open
+            elif self.state == CircuitState.OPEN:
+                if self._should_attempt_reset():
+                    self._half_open_circuit()
+            
+            # Block requests when circuit is open
+            if self.state == CircuitState.OPEN:
+                self.logger.warning(f"Circuit breaker '{self.name}' is OPEN, blocking request")
+                raise CircuitBreakerOpenException(f"Circuit breaker '{self.name}' is open")
+    
     def _record_success(self, execution_time: float):
         """Record successful execution"""
         with self.lock:
@@ -1,13 +1,17 @@
-from typing import List, Dict, Optional, Set
+from typing import Iterator, List, Dict, Optional, Set, Tuple
 from core.s3_client import S3Client
 from core.supabase_client import SupabaseClient
 from core.result_cache import ResultCache
 from models.document import Document
-from processors.processor_factory import processor_factory
+from processors.processor_factory import get_processor_factory
 from integration.n8n_webhook import N8nWebhookClient
 from config.settings import N8N_WEBHOOK_URL, N8N_API_KEY
 import logging
 import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 class DocumentManager:
     """Manages document discovery and comparison"""
@@ -75,6 +79,25 @@ class DocumentManager:
         
         return processed
     
+    def split_documents_by_status(self, prefix: str = "") -> Tuple[List[Document], List[Document]]:
+        """
+        List S3 and Supabase once and split the documents into processed and unprocessed
+        Returns (processed, unprocessed) lists of Document objects
+        """
+        processed_titles = set(self.supabase.get_processed_documents())
+        
+        processed = []
+        unprocessed = []
+        for doc in self.s3.list_documents(prefix=prefix):
+            if doc.filename in processed_titles:
+                doc.processed = True
+                processed.append(doc)
+            else:
+                unprocessed.append(doc)
+        
+        self.logger.info(f"Found {len(processed)} processed and {len(unprocessed)} unprocessed documents")
+        return processed, unprocessed
+    
     def get_document_with_metadata(self, file_id: str) -> Optional[Dict]:
         """Get document with its metadata from Supabase"""
         try:
@@ -284,7 +307,7 @@ class DocumentManager:
             # Get appropriate processor based on processing method
             processing_method = metadata.get('processing_method', 'markdown')  # Default to markdown
             self.logger.info(f"Getting processor for processing method: {processing_method} (document type: {document.document_type})")
-            processor = processor_factory.get_processor_by_method(processing_method)
+            processor = get_processor_factory().get_processor_by_method(processing_method)
             
             # Process the document
             self.logger.info(f"Starting document processing with {processor.__class__.__name__}")
@@ -354,6 +377,51 @@ class DocumentManager:
                 'webhook_result': webhook_result
             }
     
+    def iter_process_documents(self, documents_with_metadata: List[Dict], max_workers: int = 8) -> Iterator[Dict]:
+        """
+        Process documents through a sliding window of workers, yielding results in input order.
+        
+        A new document starts as soon as the oldest in-flight one is taken, so a slow download
+        or webhook holds back only its own slot rather than a whole batch. Closing the generator
+        early starts no further documents and does not wait for the ones in flight.
+        
+        Args:
+            documents_with_metadata: List of {'document': Document, 'metadata': Dict} items
+            max_workers: Maximum documents processed at the same time
+            
+        Yields:
+            process_document results, each with its 'processing_time' in seconds
+        """
+        def process_timed(item: Dict) -> Dict:
+            start_time = time.perf_counter()
+            try:
+                result = self.process_document(item['document'], item['metadata'])
+            except Exception as e:
+                result = {'success': False, 'error': str(e)}
+            result['processing_time'] = time.perf_counter() - start_time
+            return result
+        
+        if len(documents_with_metadata) <= 1:
+            for item in documents_with_metadata:
+                yield process_timed(item)
+            return
+        
+        items = iter(documents_with_metadata)
+        executor = ThreadPoolExecutor(max_workers=min(max_workers, len(documents_with_metadata)))
+        finished = False
+        try:
+            in_flight = deque(executor.submit(process_timed, item) for item in islice(items, max_workers))
+            while in_flight:
+                result = in_flight.popleft().result()
+                for item in islice(items, 1):
+                    in_flight.append(executor.submit(process_timed, item))
+                yield result
+            finished = True
+        finally:
+            # When the caller abandons the run (e.g. a Streamlit rerun interrupts the script), return
+            # at once and let documents already in flight finish in the background
+            executor.shutdown(wait=finished, cancel_futures=not finished)
+    
     def batch_process_documents(self, documents_with_metadata: List[Dict], 
                                 max_concurrent_documents: int = 3,
                                 max_concurrent_processors: int = 2,
@@ -443,7 +511,7 @@ class DocumentManager:
         
         # Validate processing method
         processing_method = metadata.get('processing_method', 'markdown')
-        if not processor_factory.supports_processing_method(processing_method):
+        if not get_processor_factory().supports_processing_method(processing_method):
             errors.append(f"Unsupported processing method: {processing_method}")
         
         return errors
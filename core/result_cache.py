@@ -1,9 +1,11 @@
 import json
 import hashlib
+import orjson
 from datetime import datetime, timedelta
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Tuple
 from pathlib import Path
 import logging
+import threading
 from dataclasses import dataclass, asdict
 from models.document import Document
 
@@ -21,6 +23,13 @@ class CacheEntry:
     file_size: int
     filename: str
     
+    def __post_init__(self):
+        # Derived once from the immutable result, so status checks are plain attribute reads;
+        # these are not dataclass fields, so they stay out of to_dict()
+        processing_info = self.processing_result.get('processing_info', {})
+        self.success: bool = bool(processing_info.get('success', False))
+        self.processor: str = processing_info.get('processor', 'Unknown')
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         result = asdict(self)
@@ -46,6 +55,13 @@ class ResultCache:
         
         # In-memory cache for faster lookups
         self._memory_cache: Dict[str, CacheEntry] = {}
+        # Document ETag -> cache keys of its entries, in insertion order
+        self._etag_index: Dict[str, List[str]] = {}
+        # Bumped on every change to the in-memory entries, so views built from them can tell they are stale
+        self._version = 0
+        # Documents are processed on several threads and the cache is shared across sessions;
+        # reentrant so invalidate_etag can hold it around _invalidate_entry
+        self._lock = threading.RLock()
         self._load_cache_index()
     
     def _generate_cache_key(self, document: Document, metadata: Dict[str, Any]) -> str:
@@ -70,8 +86,8 @@ class ResultCache:
         try:
             for cache_file in self.cache_dir.glob("*.json"):
                 try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
+                    with open(cache_file, 'rb') as f:
+                        data = orjson.loads(f.read())
                         entry = CacheEntry.from_dict(data)
                         
                         # Skip expired entries
@@ -80,7 +96,7 @@ class ResultCache:
                             continue
                         
                         cache_key = cache_file.stem
-                        self._memory_cache[cache_key] = entry
+                        self._store_entry(cache_key, entry)
                         
                 except Exception as e:
                     logger.warning(f"Error loading cache file {cache_file}: {e}")
@@ -105,9 +121,8 @@ class ResultCache:
         cache_key = self._generate_cache_key(document, metadata)
         
         # Check memory cache first
-        if cache_key in self._memory_cache:
-            entry = self._memory_cache[cache_key]
-            
+        entry = self._memory_cache.get(cache_key)
+        if entry is not None:
             # Check if expired
             if self._is_expired(entry):
                 logger.debug(f"Cache entry expired for {document.filename}")
@@ -145,22 +160,61 @@ class ResultCache:
         )
         
         # Save to memory cache
-        self._memory_cache[cache_key] = entry
+        self._store_entry(cache_key, entry)
         
         # Save to disk
         try:
             cache_file = self._get_cache_file_path(cache_key)
-            with open(cache_file, 'w') as f:
-                json.dump(entry.to_dict(), f, indent=2)
+            with open(cache_file, 'wb') as f:
+                f.write(orjson.dumps(entry.to_dict(), option=orjson.OPT_NON_STR_KEYS))
             
             logger.info(f"Cached processing result for {document.filename}")
         except Exception as e:
             logger.error(f"Error saving cache entry for {document.filename}: {e}")
     
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever cache entries are added, replaced or removed"""
+        return self._version
+    
+    def _store_entry(self, cache_key: str, entry: CacheEntry) -> None:
+        """Add or replace an in-memory entry and keep the ETag index in step"""
+        with self._lock:
+            previous = self._memory_cache.get(cache_key)
+            if previous is not None and previous.document_etag != entry.document_etag:
+                self._unindex_entry(cache_key, previous)
+            
+            self._memory_cache[cache_key] = entry
+            self._version += 1
+            keys = self._etag_index.setdefault(entry.document_etag, [])
+            if cache_key not in keys:
+                keys.append(cache_key)
+    
+    def _entry_items(self) -> List[Tuple[str, CacheEntry]]:
+        """Snapshot of (cache key, entry) pairs, safe to iterate while other threads write"""
+        with self._lock:
+            return list(self._memory_cache.items())
+    
+    def _unindex_entry(self, cache_key: str, entry: CacheEntry) -> None:
+        """Drop a cache key from the ETag index; the caller holds the lock"""
+        keys = self._etag_index.get(entry.document_etag)
+        if keys is None:
+            return
+        try:
+            keys.remove(cache_key)
+        except ValueError:
+            pass
+        if not keys:
+            del self._etag_index[entry.document_etag]
+    
     def _invalidate_entry(self, cache_key: str) -> None:
         """Remove cache entry from memory and disk"""
         # Remove from memory
-        self._memory_cache.pop(cache_key, None)
+        with self._lock:
+            entry = self._memory_cache.pop(cache_key, None)
+            if entry is not None:
+                self._unindex_entry(cache_key, entry)
+                self._version += 1
         
         # Remove from disk
         cache_file = self._get_cache_file_path(cache_key)
@@ -175,16 +229,35 @@ class ResultCache:
         Invalidate all cached entries for a specific document.
         Useful when document is updated or reprocessed.
         """
-        to_remove = []
-        for cache_key, entry in self._memory_cache.items():
-            if entry.document_etag == document.etag:
-                to_remove.append(cache_key)
-        
-        for cache_key in to_remove:
-            self._invalidate_entry(cache_key)
+        removed = self.invalidate_etag(document.etag)
         
-        if to_remove:
-            logger.info(f"Invalidated {len(to_remove)} cache entries for {document.filename}")
+        if removed:
+            logger.info(f"Invalidated {removed} cache entries for {document.filename}")
+    
+    def invalidate_etag(self, etag: str) -> int:
+        """
+        Invalidate all cached entries for a document ETag.
+        Returns number of entries removed.
+        """
+        with self._lock:
+            cache_keys = list(self._etag_index.get(etag, ()))
+            for cache_key in cache_keys:
+                self._invalidate_entry(cache_key)
+        return len(cache_keys)
+    
+    def get_entries_by_etag(self, etag: str) -> Dict[str, CacheEntry]:
+        """Get cached entries for a document ETag, keyed by cache key"""
+        with self._lock:
+            return {cache_key: self._memory_cache[cache_key] for cache_key in self._etag_index.get(etag, ())}
+    
+    def snapshot_by_etag(self) -> Dict[str, bool]:
+        """
+        Map each cached document ETag to the success flag of its first cached entry.
+        Lets callers check many documents with one dict lookup each.
+        """
+        with self._lock:
+            first_keys = [(etag, cache_keys[0]) for etag, cache_keys in self._etag_index.items()]
+            return {etag: self._memory_cache[cache_key].success for etag, cache_key in first_keys}
     
     def cleanup_expired(self) -> int:
         """
@@ -192,7 +265,7 @@ class ResultCache:
         Returns number of entries removed.
         """
         expired_keys = []
-        for cache_key, entry in self._memory_cache.items():
+        for cache_key, entry in self._entry_items():
             if self._is_expired(entry):
                 expired_keys.append(cache_key)
         
@@ -206,7 +279,8 @@ class ResultCache:
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        total_entries = len(self._memory_cache)
+        entries = [entry for _, entry in self._entry_items()]
+        total_entries = len(entries)
         cache_size_mb = 0
         
         try:
@@ -217,7 +291,7 @@ class ResultCache:
         
         # Group by document type
         type_distribution = {}
-        for entry in self._memory_cache.values():
+        for entry in entries:
             doc_type = entry.document_type
             type_distribution[doc_type] = type_distribution.get(doc_type, 0) + 1
         
@@ -234,9 +308,8 @@ class ResultCache:
         Returns number of entries cleared.
         """
         failed_keys = []
-        for cache_key, entry in self._memory_cache.items():
-            processing_info = entry.processing_result.get('processing_info', {})
-            if not processing_info.get('success', False):
+        for cache_key, entry in self._entry_items():
+            if not entry.success:
                 failed_keys.append(cache_key)
         
         for cache_key in failed_keys:
@@ -250,7 +323,10 @@ class ResultCache:
     def clear_all(self) -> None:
         """Clear all cache entries"""
         # Clear memory cache
-        self._memory_cache.clear()
+        with self._lock:
+            self._memory_cache.clear()
+            self._etag_index.clear()
+            self._version += 1
         
         # Clear disk cache
         try:
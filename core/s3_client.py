@@ -12,15 +12,22 @@ class S3Client:
         self.s3 = boto3.client('s3', **aws_config)
         self.logger = logging.getLogger(__name__)
     
-    def list_documents(self, prefix: str = "", batch_size: int = 1000) -> Generator[Document, None, None]:
+    def list_documents(self, prefix: str = "", batch_size: int = 1000,
+                       max_results: Optional[int] = None) -> Generator[Document, None, None]:
         """
         List all documents in S3 bucket with pagination
-        Yields Document objects
+        Yields Document objects built from the listing itself, without per-object HEAD requests
         """
         try:
             paginator = self.s3.get_paginator('list_objects_v2')
             
-            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            # batch_size is the MaxKeys per ListObjectsV2 page; max_results stops paginating early
+            pagination_config = {'PageSize': batch_size}
+            if max_results is not None:
+                pagination_config['MaxItems'] = max_results
+            
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix,
+                                           PaginationConfig=pagination_config):
                 if 'Contents' not in page:
                     continue
                     
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Optional, Dict
+from typing import List, NamedTuple, Optional, Dict
 from datetime import datetime
 
 @dataclass
@@ -66,4 +66,12 @@ class ProcessedDocument:
             'success': self.success,
             'error': self.error,
             'processing_time': self.processing_time
-        }
\ No newline at end of file
+        }
+
+class ChunkDocumentView(NamedTuple):
+    """Read-only stand-in for a Document when processing one chunk of it"""
+    filename: str
+    document_type: Optional[str]
+    s3_key: str
+    file_size: int
+    etag: str
@@ -2,19 +2,30 @@
 Asynchronous document processing queue management.
 """
 
+from __future__ import annotations
+
 import asyncio
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Callable, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
-import json
 from models.document import Document
-from core.document_manager import DocumentManager
+
+if TYPE_CHECKING:
+    from core.document_manager import DocumentManager
 
 
 logger = logging.getLogger(__name__)
 
+# Priority aging: pending tasks are ordered by K = -AGING_ALPHA * enqueue_time + AGING_BETA * priority,
+# so one priority level is worth AGING_BETA seconds of waiting and low-priority tasks cannot starve.
+AGING_ALPHA = 1.0
+AGING_BETA = 60.0
+
 
 class ProcessingStatus(Enum):
     """Processing status enumeration."""
@@ -40,16 +51,23 @@ class ProcessingTask:
     retry_count: int = 0
     max_retries: int = 3
     priority: int = 0  # Higher numbers = higher priority
+    created_at_monotonic: float = field(default_factory=time.monotonic, repr=False)
+    _doc_dict: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.created_at is None:
             self.created_at = datetime.utcnow()
+        self._doc_dict = self.document.to_dict()
+    
+    def refresh_document_dict(self) -> None:
+        """Re-serialize the document after it was updated during processing."""
+        self._doc_dict = self.document.to_dict()
     
     def to_dict(self) -> Dict:
         """Convert task to dictionary."""
         return {
             'task_id': self.task_id,
-            'document': self.document.to_dict(),
+            'document': self._doc_dict,
             'metadata': self.metadata,
             'status': self.status.value,
             'created_at': self.created_at.isoformat(),
@@ -80,10 +98,12 @@ class ProcessingQueue:
         
         # Queue management
         self.tasks: Dict[str, ProcessingTask] = {}
-        self.pending_queue: List[str] = []  # Task IDs sorted by priority
+        self.pending_queue: List[Tuple[float, int, str]] = []  # Heap of (-K, sequence, task ID)
+        self._pending_sequence = itertools.count()
         self.processing_tasks: Dict[str, asyncio.Task] = {}
         self.completed_tasks: List[str] = []
         self.failed_tasks: List[str] = []
+        self.cancelled_tasks: List[str] = []
         
         # Control flags
         self.is_running = False
@@ -101,6 +121,16 @@ class ProcessingQueue:
         
         # Progress callback
         self.progress_callback: Optional[Callable] = None
+        
+        # Completion futures handed out by wait_for(), keyed by task ID
+        self._waiters: Dict[str, asyncio.Future] = {}
+        
+        # Terminal status -> (task ID list, stats key), used by _transition()
+        self._terminal_map = {
+            ProcessingStatus.COMPLETED: (self.completed_tasks, 'completed_tasks'),
+            ProcessingStatus.FAILED: (self.failed_tasks, 'failed_tasks'),
+            ProcessingStatus.CANCELLED: (self.cancelled_tasks, 'cancelled_tasks')
+        }
     
     def add_task(
         self,
@@ -129,10 +159,10 @@ class ProcessingQueue:
         )
         
         self.tasks[task_id] = task
-        self.pending_queue.append(task_id)
         
-        # Sort by priority (higher priority first)
-        self.pending_queue.sort(key=lambda tid: self.tasks[tid].priority, reverse=True)
+        # Highest aged priority K pops first; the sequence number keeps FIFO order on ties
+        key = AGING_ALPHA * task.created_at_monotonic - AGING_BETA * task.priority
+        heapq.heappush(self.pending_queue, (key, next(self._pending_sequence), task_id))
         
         self.stats['total_tasks'] += 1
         
@@ -196,6 +226,7 @@ class ProcessingQueue:
             'processing_tasks': len(self.processing_tasks),
             'completed_tasks': len(self.completed_tasks),
             'failed_tasks': len(self.failed_tasks),
+            'cancelled_tasks': len(self.cancelled_tasks),
             'total_tasks': len(self.tasks),
             'max_workers': self.max_workers,
             'statistics': self.stats
@@ -203,7 +234,7 @@ class ProcessingQueue:
     
     def get_pending_tasks(self) -> List[Dict]:
         """Get list of pending tasks."""
-        return [self.tasks[task_id].to_dict() for task_id in self.pending_queue]
+        return [self.tasks[task_id].to_dict() for _, _, task_id in sorted(self.pending_queue)]
     
     def get_processing_tasks(self) -> List[Dict]:
         """Get list of currently processing tasks."""
@@ -217,6 +248,45 @@ class ProcessingQueue:
         """Get list of failed tasks."""
         return [self.tasks[task_id].to_dict() for task_id in self.failed_tasks]
     
+    async def wait_for(self, task_id: str) -> Dict:
+        """
+        Wait for a task to finish, independently of any other task.
+        
+        Each call resolves as soon as its own task completes, fails or is
+        cancelled, so callers can consume results in completion order:
+        
+            for next_done in asyncio.as_completed([queue.wait_for(t) for t in task_ids]):
+                result = await next_done
+        
+        Args:
+            task_id: Task ID to wait for
+            
+        Returns:
+            Final task dictionary
+            
+        Raises:
+            ValueError: If the task ID is unknown
+        """
+        if task_id not in self.tasks:
+            raise ValueError(f"Unknown task: {task_id}")
+        
+        task = self.tasks[task_id]
+        if task.status in (ProcessingStatus.COMPLETED, ProcessingStatus.FAILED, ProcessingStatus.CANCELLED):
+            return task.to_dict()
+        
+        future = self._waiters.get(task_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._waiters[task_id] = future
+        
+        return await asyncio.shield(future)
+    
+    def _resolve_waiter(self, task_id: str, task_dict: Dict) -> None:
+        """Resolve the wait_for() future of a finished task, if any."""
+        future = self._waiters.pop(task_id, None)
+        if future is not None and not future.done():
+            future.set_result(task_dict)
+    
     async def process_single_task(self, task_id: str) -> Dict:
         """
         Process a single task.
@@ -230,13 +300,7 @@ class ProcessingQueue:
         task = self.tasks[task_id]
         
         try:
-            # Update task status
-            task.status = ProcessingStatus.PROCESSING
-            task.started_at = datetime.utcnow()
-            
-            # Notify progress callback
-            if self.progress_callback:
-                self.progress_callback(task.to_dict())
+            self._transition(task, ProcessingStatus.PROCESSING)
             
             self.logger.info(f"Processing task {task_id}: {task.document.filename}")
             
@@ -246,51 +310,85 @@ class ProcessingQueue:
                 task.metadata
             )
             
-            # Update task with result
-            task.completed_at = datetime.utcnow()
-            task.result = result
-            
             if result.get('success', False):
-                task.status = ProcessingStatus.COMPLETED
-                self.completed_tasks.append(task_id)
-                self.stats['completed_tasks'] += 1
+                task_dict = self._transition(task, ProcessingStatus.COMPLETED, result=result)
             else:
-                task.status = ProcessingStatus.FAILED
-                task.error = result.get('error', 'Unknown error')
-                self.failed_tasks.append(task_id)
-                self.stats['failed_tasks'] += 1
-            
-            # Update processing time statistics
-            if task.started_at and task.completed_at:
-                processing_time = (task.completed_at - task.started_at).total_seconds()
-                self.stats['processing_time_total'] += processing_time
-                completed_count = self.stats['completed_tasks'] + self.stats['failed_tasks']
-                if completed_count > 0:
-                    self.stats['average_processing_time'] = self.stats['processing_time_total'] / completed_count
-            
-            # Notify progress callback
-            if self.progress_callback:
-                self.progress_callback(task.to_dict())
+                task_dict = self._transition(
+                    task,
+                    ProcessingStatus.FAILED,
+                    result=result,
+                    error=result.get('error', 'Unknown error')
+                )
             
             self.logger.info(f"Task {task_id} completed with status: {task.status.value}")
-            return task.to_dict()
+            return task_dict
             
         except Exception as e:
-            # Handle task failure
-            task.status = ProcessingStatus.FAILED
-            task.error = str(e)
-            task.completed_at = datetime.utcnow()
-            
-            self.failed_tasks.append(task_id)
-            self.stats['failed_tasks'] += 1
-            
             self.logger.error(f"Task {task_id} failed: {str(e)}")
+            return self._transition(task, ProcessingStatus.FAILED, error=str(e))
+    
+    def _transition(
+        self,
+        task: ProcessingTask,
+        new_status: ProcessingStatus,
+        *,
+        result: Optional[Dict] = None,
+        error: Optional[str] = None
+    ) -> Dict:
+        """
+        Move a task to a new status and record the bookkeeping for it.
+        
+        Stamps the task, files it under the matching terminal list, updates
+        statistics, notifies the progress callback and resolves any
+        wait_for() future.
+        
+        Args:
+            task: Task to update
+            new_status: Status to move the task to
+            result: Processing result, if any
+            error: Error message, if any
+            
+        Returns:
+            Task dictionary after the transition
+        """
+        task.status = new_status
+        if result is not None:
+            task.result = result
+        if error is not None:
+            task.error = error
+        
+        stats = self.stats
+        terminal = self._terminal_map.get(new_status)
+        
+        if terminal is None:
+            task.started_at = datetime.utcnow()
+        else:
+            # Processing fills in document type and machine names
+            task.refresh_document_dict()
             
-            # Notify progress callback
-            if self.progress_callback:
-                self.progress_callback(task.to_dict())
+            task_ids, stats_key = terminal
+            task_ids.append(task.task_id)
+            stats[stats_key] += 1
             
-            return task.to_dict()
+            if new_status is not ProcessingStatus.CANCELLED:
+                task.completed_at = datetime.utcnow()
+                
+                # Update processing time statistics
+                if task.started_at:
+                    stats['processing_time_total'] += (task.completed_at - task.started_at).total_seconds()
+                    finished_count = stats['completed_tasks'] + stats['failed_tasks']
+                    stats['average_processing_time'] = stats['processing_time_total'] / finished_count
+        
+        task_dict = task.to_dict()
+        
+        # Notify progress callback
+        if self.progress_callback:
+            self.progress_callback(task_dict)
+        
+        if terminal is not None:
+            self._resolve_waiter(task.task_id, task_dict)
+        
+        return task_dict
     
     async def worker(self, worker_id: int) -> None:
         """
@@ -313,7 +411,7 @@ class ProcessingQueue:
                     await asyncio.sleep(0.1)
                     continue
                 
-                task_id = self.pending_queue.pop(0)
+                _, _, task_id = heapq.heappop(self.pending_queue)
                 
                 # Add to processing tasks
                 self.processing_tasks[task_id] = asyncio.current_task()
@@ -362,7 +460,7 @@ class ProcessingQueue:
         self.logger.info("Processing queue resumed")
     
     def stop(self) -> None:
-        """Stop the processing queue."""
+        """Stop the processing queue, cancelling every task that has not finished."""
         self.is_running = False
         self.is_paused = False
         
@@ -370,7 +468,17 @@ class ProcessingQueue:
         for task in self.processing_tasks.values():
             task.cancel()
         
-        self.logger.info("Processing queue stopped")
+        # Pending and interrupted tasks would never reach a terminal status, leaving their
+        # wait_for() callers hanging; cancel them through the usual transition instead
+        unfinished = [task_id for _, _, task_id in self.pending_queue] + list(self.processing_tasks)
+        self.pending_queue.clear()
+        self.processing_tasks.clear()
+        for task_id in unfinished:
+            task = self.tasks.get(task_id)
+            if task is not None and task.status not in self._terminal_map:
+                self._transition(task, ProcessingStatus.CANCELLED)
+        
+        self.logger.info(f"Processing queue stopped, {len(unfinished)} unfinished tasks cancelled")
     
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -388,10 +496,11 @@ class ProcessingQueue:
         task = self.tasks[task_id]
         
         # Remove from pending queue
-        if task_id in self.pending_queue:
-            self.pending_queue.remove(task_id)
-            task.status = ProcessingStatus.CANCELLED
-            self.stats['cancelled_tasks'] += 1
+        pending_entry = next((entry for entry in self.pending_queue if entry[2] == task_id), None)
+        if pending_entry is not None:
+            self.pending_queue.remove(pending_entry)
+            heapq.heapify(self.pending_queue)
+            self._transition(task, ProcessingStatus.CANCELLED)
             self.logger.info(f"Task {task_id} cancelled")
             return True
         
@@ -399,8 +508,7 @@ class ProcessingQueue:
         if task_id in self.processing_tasks:
             asyncio_task = self.processing_tasks[task_id]
             asyncio_task.cancel()
-            task.status = ProcessingStatus.CANCELLED
-            self.stats['cancelled_tasks'] += 1
+            self._transition(task, ProcessingStatus.CANCELLED)
             self.logger.info(f"Processing task {task_id} cancelled")
             return True
         
@@ -408,7 +516,7 @@ class ProcessingQueue:
     
     def clear_completed(self) -> int:
         """
-        Clear completed tasks from memory.
+        Clear completed, failed and cancelled tasks from memory.
         
         Returns:
             Number of tasks cleared
@@ -431,7 +539,15 @@ class ProcessingQueue:
         
         self.failed_tasks.clear()
         
-        self.logger.info(f"Cleared {cleared_count} completed/failed tasks")
+        # Clear cancelled tasks
+        for task_id in self.cancelled_tasks[:]:
+            if task_id in self.tasks:
+                del self.tasks[task_id]
+                cleared_count += 1
+        
+        self.cancelled_tasks.clear()
+        
+        self.logger.info(f"Cleared {cleared_count} completed/failed/cancelled tasks")
         return cleared_count
     
     def set_progress_callback(self, callback: Callable) -> None:
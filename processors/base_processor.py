@@ -62,4 +62,8 @@ class BaseProcessor(ABC):
         Returns:
             True if content is valid for processing
         """
-        return content is not None and len(content) > 0
\ No newline at end of file
+        return content is not None and len(content) > 0
+    
+    def close(self) -> None:
+        """Release resources held by the processor (connections, pools)."""
+        pass
\ No newline at end of file
@@ -2,8 +2,12 @@
 Factory for creating appropriate document processors based on document type.
 """
 
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Hashable, Mapping, Optional, Tuple
+import concurrent.futures
 import logging
+import threading
+import weakref
 from .base_processor import BaseProcessor
 from .pymupdf_processor import PyMuPDFProcessor
 from .datalabs_processor import DataLabsProcessor
@@ -12,6 +16,17 @@ from .datalabs_processor import DataLabsProcessor
 logger = logging.getLogger(__name__)
 
 
+def _freeze(value: Any) -> Hashable:
+    """Convert a configuration value into a hashable equivalent for use as a cache key"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
 class ProcessorFactory:
     """Factory for creating document processors based on processing method."""
     
@@ -30,6 +45,28 @@ class ProcessorFactory:
         'plain_document': PyMuPDFProcessor,
     }
     
+    # Processing methods and legacy document types in one table; the two key sets never overlap
+    _PROCESSOR_LOOKUP = {**LEGACY_DOCUMENT_TYPE_MAPPING, **PROCESSOR_MAPPING}
+    
+    # Legacy document type -> processing method served by the same processor class
+    _METHOD_BY_CLASS = dict(map(reversed, PROCESSOR_MAPPING.items()))
+    _LEGACY_METHODS = dict(zip(LEGACY_DOCUMENT_TYPE_MAPPING, map(_METHOD_BY_CLASS.get, LEGACY_DOCUMENT_TYPE_MAPPING.values())))
+    
+    # Processor class name -> class, for configuration by name
+    _NAME_TO_CLASS = {cls.__name__: cls for cls in _PROCESSOR_LOOKUP.values()}
+    
+    # Read-only views handed out as is, so callers polling them allocate nothing
+    _AVAILABLE_PROCESSORS = MappingProxyType({method: cls.__name__ for method, cls in PROCESSOR_MAPPING.items()})
+    _AVAILABLE_METHODS = tuple(PROCESSOR_MAPPING)
+    
+    # Processors shared by every factory asking for the same class and config, so HTTP sessions
+    # and document pools are not rebuilt per factory; entries vanish once no factory holds them
+    _shared_instances: 'weakref.WeakValueDictionary' = weakref.WeakValueDictionary()
+    _shared_lock = threading.Lock()
+    
+    # Instances only carry these attributes; slots skip the per-instance __dict__
+    __slots__ = ('config', '_processor_instances', '_method_instances')
+    
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize the processor factory.
@@ -39,6 +76,8 @@ class ProcessorFactory:
         """
         self.config = config or {}
         self._processor_instances = {}
+        # Processing method -> processor, so repeat lookups are a single dict access
+        self._method_instances: Dict[str, BaseProcessor] = {}
     
     def get_processor_by_method(self, processing_method: str) -> BaseProcessor:
         """
@@ -53,6 +92,13 @@ class ProcessorFactory:
         Raises:
             ValueError: If processing method is not supported
         """
+        processor = self._method_instances.get(processing_method)
+        if processor is not None:
+            return processor
+        return self._create_for_method(processing_method)
+    
+    def _create_for_method(self, processing_method: str) -> BaseProcessor:
+        """Resolve, create if needed and remember the processor for a processing method"""
         if processing_method not in self.PROCESSOR_MAPPING:
             raise ValueError(f"Unsupported processing method: {processing_method}. Supported: {list(self.PROCESSOR_MAPPING.keys())}")
         
@@ -60,21 +106,50 @@ class ProcessorFactory:
         
         # Return cached instance if available
         if processor_class in self._processor_instances:
-            return self._processor_instances[processor_class]
+            processor = self._processor_instances[processor_class]
+            self._method_instances[processing_method] = processor
+            return processor
         
         # Create new instance
         try:
             processor_config = self.config.get(processor_class.__name__, {})
-            processor = processor_class(processor_config)
+            processor = self._shared_processor(processor_class, processor_config)
             self._processor_instances[processor_class] = processor
+            self._method_instances[processing_method] = processor
             
-            logger.info(f"Created processor {processor_class.__name__} for processing method: {processing_method}")
+            logger.info("Created processor %s for processing method: %s", processor_class.__name__, processing_method)
             return processor
             
         except Exception as e:
-            logger.error(f"Failed to create processor for processing method {processing_method}: {str(e)}")
+            logger.error("Failed to create processor for processing method %s: %s", processing_method, e)
             raise
     
+    @classmethod
+    def _shared_processor(cls, processor_class: type, processor_config: Dict[str, Any]) -> BaseProcessor:
+        """
+        Get the shared processor for a class and configuration, creating it if no factory holds one.
+        
+        Args:
+            processor_class: Processor class to instantiate
+            processor_config: Configuration for the processor
+            
+        Returns:
+            Processor instance
+        """
+        try:
+            key = (processor_class, _freeze(processor_config))
+            hash(key)
+        except TypeError:
+            # Unhashable configuration values cannot be matched, so the processor is not shared
+            return processor_class(processor_config)
+        
+        with cls._shared_lock:
+            processor = cls._shared_instances.get(key)
+            if processor is None:
+                processor = processor_class(processor_config)
+                cls._shared_instances[key] = processor
+            return processor
+    
     def get_processor(self, document_type: str) -> BaseProcessor:
         """
         DEPRECATED: Get processor by document type. Use get_processor_by_method instead.
@@ -88,50 +163,40 @@ class ProcessorFactory:
         Raises:
             ValueError: If document type is not supported
         """
-        logger.warning(f"Using deprecated get_processor method with document_type: {document_type}. Use get_processor_by_method instead.")
+        logger.warning("Using deprecated get_processor method with document_type: %s. Use get_processor_by_method instead.", document_type)
         
         if document_type not in self.LEGACY_DOCUMENT_TYPE_MAPPING:
             raise ValueError(f"Unsupported document type: {document_type}")
         
-        processor_class = self.LEGACY_DOCUMENT_TYPE_MAPPING[document_type]
-        
-        # Return cached instance if available
-        if processor_class in self._processor_instances:
-            return self._processor_instances[processor_class]
-        
-        # Create new instance
-        try:
-            processor_config = self.config.get(processor_class.__name__, {})
-            processor = processor_class(processor_config)
-            self._processor_instances[processor_class] = processor
-            
-            logger.info(f"Created processor {processor_class.__name__} for document type: {document_type} (legacy)")
-            return processor
-            
-        except Exception as e:
-            logger.error(f"Failed to create processor for document type {document_type}: {str(e)}")
-            raise
+        return self.get_processor_by_method(self._LEGACY_METHODS[document_type])
+    
+    def close(self) -> None:
+        """Close all cached processor instances and release their connections."""
+        for processor in self._processor_instances.values():
+            try:
+                processor.close()
+            except Exception as e:
+                logger.warning("Error closing processor %s: %s", type(processor).__name__, e)
+        self._processor_instances.clear()
+        self._method_instances.clear()
     
-    def get_available_processors(self) -> Dict[str, str]:
+    def get_available_processors(self) -> Mapping[str, str]:
         """
         Get mapping of processing methods to processor names.
         
         Returns:
-            Dictionary mapping processing methods to processor class names
+            Read-only mapping of processing methods to processor class names
         """
-        return {
-            method: processor_class.__name__ 
-            for method, processor_class in self.PROCESSOR_MAPPING.items()
-        }
+        return self._AVAILABLE_PROCESSORS
     
-    def get_available_processing_methods(self) -> List[str]:
+    def get_available_processing_methods(self) -> Tuple[str, ...]:
         """
-        Get list of available processing methods.
+        Get available processing methods.
         
         Returns:
-            List of supported processing methods
+            Tuple of supported processing methods
         """
-        return list(self.PROCESSOR_MAPPING.keys())
+        return self._AVAILABLE_METHODS
     
     def supports_processing_method(self, processing_method: str) -> bool:
         """
@@ -168,11 +233,19 @@ class ProcessorFactory:
         Returns:
             Appropriate processor instance
         """
-        if processing_method:
-            return self.get_processor_by_method(processing_method)
-        else:
-            # Fallback to legacy method (deprecated)
-            return self.get_processor(document.document_type)
+        # Without a processing method the document type is the (deprecated) lookup key
+        return self._lookup(processing_method or document.document_type)
+    
+    def _lookup(self, key: str) -> BaseProcessor:
+        """Resolve a processing method or legacy document type to a processor in one table"""
+        processor = self._method_instances.get(key)
+        if processor is not None:
+            return processor
+        
+        if key not in self._PROCESSOR_LOOKUP:
+            raise ValueError(f"Unsupported processing method or document type: {key}")
+        
+        return self.get_processor_by_method(self._LEGACY_METHODS.get(key, key))
     
     def configure_processor(self, processor_name: str, config: Dict[str, Any]) -> None:
         """
@@ -185,19 +258,18 @@ class ProcessorFactory:
         self.config[processor_name] = config
         
         # Clear cached instance to force recreation with new config
-        processor_class = None
-        for doc_type, cls in self.PROCESSOR_MAPPING.items():
-            if cls.__name__ == processor_name:
-                processor_class = cls
-                break
-        
+        processor_class = self._NAME_TO_CLASS.get(processor_name)
         if processor_class and processor_class in self._processor_instances:
-            del self._processor_instances[processor_class]
-            logger.info(f"Cleared cached instance for {processor_name} due to configuration change")
+            stale = self._processor_instances.pop(processor_class)
+            for method, processor in list(self._method_instances.items()):
+                if processor is stale:
+                    del self._method_instances[method]
+            logger.info("Cleared cached instance for %s due to configuration change", processor_name)
     
     def clear_cache(self) -> None:
         """Clear all cached processor instances."""
         self._processor_instances.clear()
+        self._method_instances.clear()
         logger.info("Cleared all cached processor instances")
     
     @classmethod
@@ -210,12 +282,22 @@ class ProcessorFactory:
         """
         return {
             'PyMuPDFProcessor': {
-                'extract_images': False
+                'extract_images': False,
+                'doc_cache_mb': 64,
+                'parallel_min_pages': 64
             },
             'DataLabsProcessor': {
                 'base_url': 'https://api.datalabs.com',
                 'timeout': 300,
-                'poll_interval': 10
+                'poll_interval': 10,
+                'poll_backoff_min': 0.5,
+                'poll_backoff_max': 30,
+                'poll_backoff_base': 1.3,
+                'poll_max_errors': 5,
+                'max_parallel_chunks': 4,
+                'cache_ttl': 7 * 24 * 3600,
+                'use_llm': None,
+                'debug': False
             }
         }
     
@@ -226,21 +308,44 @@ class ProcessorFactory:
         Returns:
             Dictionary mapping processor names to validation status
         """
-        results = {}
-        
-        for doc_type, processor_class in self.PROCESSOR_MAPPING.items():
-            try:
-                processor_config = self.config.get(processor_class.__name__, {})
-                processor = processor_class(processor_config)
-                results[processor_class.__name__] = True
-                logger.info(f"Processor {processor_class.__name__} validated successfully")
-                
-            except Exception as e:
-                results[processor_class.__name__] = False
-                logger.error(f"Processor {processor_class.__name__} validation failed: {str(e)}")
+        # Each class is validated once, concurrently; results keep mapping order
+        processor_classes = list(dict.fromkeys(self.PROCESSOR_MAPPING.values()))
         
-        return results
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(processor_classes)) as executor:
+            futures = [executor.submit(self._validate_processor, processor_class) for processor_class in processor_classes]
+            return {
+                processor_class.__name__: future.result()
+                for processor_class, future in zip(processor_classes, futures)
+            }
+    
+    def _validate_processor(self, processor_class: type) -> bool:
+        """Instantiate one processor class as a throwaway check, releasing it afterwards"""
+        try:
+            processor_config = self.config.get(processor_class.__name__, {})
+            processor = processor_class(processor_config)
+            processor.close()
+            logger.info("Processor %s validated successfully", processor_class.__name__)
+            return True
+            
+        except Exception as e:
+            logger.error("Processor %s validation failed: %s", processor_class.__name__, e)
+            return False
 
 
-# Global factory instance
-processor_factory = ProcessorFactory()
\ No newline at end of file
+# Global factory instance, created on first use
+_processor_factory: Optional[ProcessorFactory] = None
+
+def get_processor_factory() -> ProcessorFactory:
+    """Get processor factory instance (singleton)"""
+    global _processor_factory
+    
+    if _processor_factory is None:
+        _processor_factory = ProcessorFactory()
+    
+    return _processor_factory
+
+def __getattr__(name: str):
+    """Keep `from processors.processor_factory import processor_factory` working without an import-time instance"""
+    if name == 'processor_factory':
+        return get_processor_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -4,7 +4,16 @@ Simple text extraction with page-level identification.
 """
 
 import pymupdf
-from typing import Dict, Any, List
+import concurrent.futures
+import hashlib
+import multiprocessing
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import repeat
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from io import BytesIO
 import logging
 from .base_processor import BaseProcessor
@@ -13,6 +22,145 @@ from models.document import Document
 
 logger = logging.getLogger(__name__)
 
+# Leading bytes of every PDF file
+_PDF_MAGIC = b'%PDF-'
+
+# Runs of spaces inside a line
+_SPACE_RUN_RE = re.compile(r' +')
+
+# Substrings that mean ASCII text still needs cleaning: space runs, whitespace at a line edge,
+# empty lines, or whitespace other than space and newline (which str.strip would remove at line edges)
+_UNCLEAN_MARKERS = ('  ', ' \n', '\n ', '\n\n', '\t', '\r', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x1f')
+
+# Plain-text extraction without ligature or whitespace preservation: ligatures come out
+# as their letters and odd whitespace as spaces, which _clean_text collapses anyway
+_TEXT_FLAGS = pymupdf.TEXT_MEDIABOX_CLIP | pymupdf.TEXT_CID_FOR_UNKNOWN_UNICODE
+
+
+# Raw page text, page width, page height and image count (None unless requested)
+PageRow = Tuple[str, float, float, Optional[int]]
+
+
+def _read_pages(pdf_document: pymupdf.Document, start: int, stop: int, extract_images: bool) -> List[PageRow]:
+    """Read the raw text and page facts for pages [start, stop) of an open PDF"""
+    rows = []
+    for page_num in range(start, stop):
+        page = pdf_document[page_num]
+        rect = page.rect
+        # Image listing reads the page resources only; it does not parse the content stream again
+        image_count = len(page.get_images(full=False)) if extract_images else None
+        # One explicit text page, read directly, skips get_text's per-call option handling
+        text = page.get_textpage(flags=_TEXT_FLAGS).extractText()
+        rows.append((text, rect.width, rect.height, image_count))
+    return rows
+
+
+def _read_page_range(content: bytes, start: int, stop: int, extract_images: bool) -> List[PageRow]:
+    """Worker-process entry point: open the PDF privately and read one page range"""
+    with pymupdf.open(stream=content, filetype="pdf") as pdf_document:
+        return _read_pages(pdf_document, start, stop, extract_images)
+
+
+# Worker count -> long-lived extraction pool, created on first use
+_EXTRACT_POOLS: Dict[int, concurrent.futures.ProcessPoolExecutor] = {}
+_EXTRACT_POOLS_LOCK = threading.Lock()
+
+
+def _get_extract_pool(max_workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    """
+    Long-lived worker pool for large PDFs, shared by processors with the same worker count.
+    Workers come from a forkserver (spawn where unavailable), never from a fork of this
+    multithreaded process, and are started once rather than per PDF.
+    """
+    with _EXTRACT_POOLS_LOCK:
+        pool = _EXTRACT_POOLS.get(max_workers)
+        if pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+            pool = _EXTRACT_POOLS[max_workers] = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=context
+            )
+        return pool
+
+
+def _discard_extract_pool(max_workers: int, pool: concurrent.futures.ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next large PDF starts a fresh one; pools for other worker counts stay"""
+    with _EXTRACT_POOLS_LOCK:
+        if _EXTRACT_POOLS.get(max_workers) is pool:
+            del _EXTRACT_POOLS[max_workers]
+    pool.shutdown(wait=False)
+
+
+class _PdfDocumentPool:
+    """
+    Small LRU of opened PDF documents keyed by content hash, bounded by the bytes they were opened from.
+    A document is checked out while in use, since PyMuPDF documents are not thread-safe.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._documents: 'OrderedDict[bytes, tuple]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def open(self, content: bytes) -> Iterator[pymupdf.Document]:
+        """
+        Open a PDF, reusing an idle parsed copy of the same content when one is pooled.
+        
+        Args:
+            content: Raw PDF content
+            
+        Yields:
+            Opened document, owned by the caller until the block exits
+        """
+        if len(content) > self.max_bytes:
+            # Could never be pooled (or pooling is off); skip hashing what is likely a large file
+            with pymupdf.open(stream=content, filetype="pdf") as document:
+                yield document
+            return
+        
+        key = hashlib.blake2b(content, digest_size=16).digest()
+        with self._lock:
+            entry = self._documents.pop(key, None)
+            if entry is not None:
+                self._size -= entry[1]
+        
+        document = entry[0] if entry is not None else pymupdf.open(stream=content, filetype="pdf")
+        try:
+            yield document
+        except BaseException:
+            document.close()
+            raise
+        self._check_in(key, document, len(content))
+    
+    def _check_in(self, key: bytes, document: pymupdf.Document, size: int) -> None:
+        """Return a document to the pool, closing whatever no longer fits"""
+        evicted = []
+        with self._lock:
+            if size > self.max_bytes or key in self._documents:
+                evicted.append(document)
+            else:
+                self._documents[key] = (document, size)
+                self._size += size
+                while self._size > self.max_bytes:
+                    _, (old_document, old_size) = self._documents.popitem(last=False)
+                    self._size -= old_size
+                    evicted.append(old_document)
+        
+        for old_document in evicted:
+            old_document.close()
+    
+    def clear(self) -> None:
+        """Close every pooled document"""
+        with self._lock:
+            documents = [document for document, _ in self._documents.values()]
+            self._documents.clear()
+            self._size = 0
+        
+        for document in documents:
+            document.close()
+
 
 class PyMuPDFProcessor(BaseProcessor):
     """Processor for diagrams and technical drawings using PyMuPDF."""
@@ -22,6 +170,13 @@ class PyMuPDFProcessor(BaseProcessor):
     def __init__(self, config: Dict[str, Any] = None):
         super().__init__(config)
         self.extract_images = config.get('extract_images', False) if config else False
+        self.doc_cache_mb = config.get('doc_cache_mb', 64) if config else 64  # parsed PDFs kept for reuse, 0 disables
+        default_workers = min(4, os.cpu_count() or 1)
+        self.max_extract_workers = config.get('max_extract_workers', default_workers) if config else default_workers  # processes for large PDFs
+        self.parallel_min_pages = config.get('parallel_min_pages', 64) if config else 64  # pages before extraction fans out
+        
+        # process() and get_page_text() on the same content share one parse
+        self._doc_pool = _PdfDocumentPool(int(self.doc_cache_mb * 1024 * 1024))
     
     def supports_document_type(self, document_type: str) -> bool:
         """Check if processor supports given document type."""
@@ -42,54 +197,34 @@ class PyMuPDFProcessor(BaseProcessor):
             raise ValueError("Invalid document content")
         
         try:
-            # Open PDF from bytes
-            pdf_document = pymupdf.open(stream=content, filetype="pdf")
+            # Open PDF from bytes, or reuse a pooled parse of the same content
+            with self._doc_pool.open(content) as pdf_document:
+                total_pages = len(pdf_document)
+                if self.max_extract_workers > 1 and total_pages >= self.parallel_min_pages:
+                    page_rows = self._read_pages_parallel(content, total_pages, pdf_document)
+                else:
+                    page_rows = _read_pages(pdf_document, 0, total_pages, self.extract_images)
             
             pages = []
-            total_pages = len(pdf_document)
             
-            for page_num in range(total_pages):
-                page = pdf_document[page_num]
-                
-                # Extract text from page
-                text = page.get_text()
-                
-                # Clean and normalize text
-                cleaned_text = self._clean_text(text)
-                
-                # Create page data
-                page_data = {
-                    'page_number': page_num + 1,
-                    'page_id': f"{document.filename}_page_{page_num + 1}",
-                    'content': cleaned_text,
-                    'metadata': {
-                        'character_count': len(cleaned_text),
-                        'word_count': len(cleaned_text.split()),
-                        'has_content': bool(cleaned_text.strip()),
-                        'page_size': {
-                            'width': page.rect.width,
-                            'height': page.rect.height
-                        }
-                    }
-                }
-                
-                # Add image information if requested
-                if self.extract_images:
-                    page_data['metadata']['image_count'] = len(page.get_images())
-                
-                pages.append(page_data)
-            
-            pdf_document.close()
+            # Document totals accumulate per page instead of re-joining all page text
+            total_characters = 0
+            total_words = 0
+            pages_with_content = 0
             
-            # Calculate document-level statistics
-            total_text = ' '.join([p['content'] for p in pages])
+            for page_data in self._build_pages(document.filename, page_rows):
+                metadata = page_data['metadata']
+                total_characters += metadata['character_count']
+                total_words += metadata['word_count']
+                pages_with_content += metadata['has_content']
+                pages.append(page_data)
             
             return {
                 'pages': pages,
                 'document_metadata': {
                     'total_pages': total_pages,
-                    'total_characters': len(total_text),
-                    'total_words': len(total_text.split()),
+                    'total_characters': total_characters,
+                    'total_words': total_words,
                     'processing_method': 'pymupdf_text_extraction',
                     'document_type': document.document_type,
                     'filename': document.filename
@@ -98,7 +233,7 @@ class PyMuPDFProcessor(BaseProcessor):
                     'processor': 'PyMuPDFProcessor',
                     'success': True,
                     'pages_processed': len(pages),
-                    'pages_with_content': sum(1 for p in pages if p['metadata']['has_content'])
+                    'pages_with_content': pages_with_content
                 }
             }
             
@@ -118,6 +253,107 @@ class PyMuPDFProcessor(BaseProcessor):
                 }
             }
     
+    def iter_pages(self, document: Document, content: bytes) -> Iterator[Dict[str, Any]]:
+        """
+        Extract pages one at a time, so callers that stream pages onward never hold the whole document.
+        
+        Args:
+            document: Document metadata
+            content: Raw PDF content as bytes
+            
+        Yields:
+            Page dictionaries in the same shape as process() returns
+        """
+        if not self.validate_content(content):
+            raise ValueError("Invalid document content")
+        
+        with self._doc_pool.open(content) as pdf_document:
+            extract_images = self.extract_images
+            page_rows = (
+                _read_pages(pdf_document, page_num, page_num + 1, extract_images)[0]
+                for page_num in range(len(pdf_document))
+            )
+            yield from self._build_pages(document.filename, page_rows)
+    
+    def _build_pages(self, filename: str, page_rows: Iterable[PageRow]) -> Iterator[Dict[str, Any]]:
+        """
+        Turn raw page rows into page dictionaries.
+        
+        Args:
+            filename: Document filename used in page identifiers
+            page_rows: Raw page rows in page order
+            
+        Yields:
+            Page dictionaries
+        """
+        clean_text = self._clean_text
+        
+        # Pages of one PDF mostly share a size; reuse the first float pair seen for each size
+        page_sizes = {}
+        
+        for page_num, (text, width, height, image_count) in enumerate(page_rows):
+            width, height = page_sizes.setdefault((width, height), (width, height))
+            
+            # Normalize text from page
+            cleaned_text = clean_text(text)
+            
+            # Cleaned text is stripped per line with single spaces and newlines between words
+            # (the extraction flags turn other whitespace into spaces), so counting separators
+            # gives the word count without building a list of words
+            character_count = len(cleaned_text)
+            word_count = cleaned_text.count(' ') + cleaned_text.count('\n') + 1 if cleaned_text else 0
+            
+            metadata = {
+                'character_count': character_count,
+                'word_count': word_count,
+                'has_content': bool(cleaned_text),
+                'page_size': {
+                    'width': width,
+                    'height': height
+                }
+            }
+            
+            # Add image information if requested
+            if image_count is not None:
+                metadata['image_count'] = image_count
+            
+            yield {
+                'page_number': page_num + 1,
+                'page_id': f"{filename}_page_{page_num + 1}",
+                'content': cleaned_text,
+                'metadata': metadata
+            }
+    
+    def _read_pages_parallel(self, content: bytes, total_pages: int,
+                             pdf_document: pymupdf.Document) -> List[PageRow]:
+        """
+        Read pages in the shared worker processes, each opening its own copy of the PDF.
+        PyMuPDF is not thread-safe and holds the GIL, so threads would not overlap extraction.
+        
+        Args:
+            content: Raw PDF content
+            total_pages: Number of pages in the PDF
+            pdf_document: Already opened document, used if the workers cannot run
+            
+        Returns:
+            Page rows in page order
+        """
+        workers = min(self.max_extract_workers, total_pages)
+        step = -(-total_pages // workers)
+        starts = range(0, total_pages, step)
+        stops = [min(start + step, total_pages) for start in starts]
+        
+        try:
+            executor = _get_extract_pool(self.max_extract_workers)
+            parts = executor.map(_read_page_range, repeat(content), starts, stops, repeat(self.extract_images))
+            return [row for part in parts for row in part]
+        except Exception as e:
+            if isinstance(e, concurrent.futures.BrokenExecutor):
+                # A dead worker breaks the pool for good
+                _discard_extract_pool(self.max_extract_workers, executor)
+            logger.warning(f"Parallel page extraction failed, reading pages sequentially: {str(e)}")
+            return _read_pages(pdf_document, 0, total_pages, self.extract_images)
+    
     def _clean_text(self, text: str) -> str:
         """
         Clean and normalize extracted text.
@@ -131,23 +367,19 @@ class PyMuPDFProcessor(BaseProcessor):
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line:  # Only keep non-empty lines
-                cleaned_lines.append(line)
+        # Already-clean text (typical of sparse diagram labels) is returned as is, less the
+        # single newline PyMuPDF ends every page's text with
+        body = text[:-1] if text[-1] == '\n' else text
+        if (body and body.isascii() and not body[0].isspace() and not body[-1].isspace()
+                and not any(marker in body for marker in _UNCLEAN_MARKERS)):
+            return body
         
-        # Join lines with single newline
-        cleaned_text = '\n'.join(cleaned_lines)
+        # Strip every line, drop empty ones and join the rest with a single newline;
+        # map/filter keep the per-line work out of the interpreter loop
+        cleaned_text = '\n'.join(filter(None, map(str.strip, text.split('\n'))))
         
         # Remove excessive spaces
-        import re
-        cleaned_text = re.sub(r' +', ' ', cleaned_text)
-        
-        return cleaned_text
+        return _SPACE_RUN_RE.sub(' ', cleaned_text)
     
     def validate_content(self, content: bytes) -> bool:
         """
@@ -162,8 +394,8 @@ class PyMuPDFProcessor(BaseProcessor):
         if not super().validate_content(content):
             return False
         
-        # Check PDF magic bytes
-        return content.startswith(b'%PDF-')
+        # Check PDF magic bytes; the memoryview slice never copies, whatever buffer type was passed
+        return memoryview(content)[:len(_PDF_MAGIC)] == _PDF_MAGIC
     
     def get_page_text(self, content: bytes, page_number: int) -> str:
         """
@@ -177,17 +409,19 @@ class PyMuPDFProcessor(BaseProcessor):
             Text content of the page
         """
         try:
-            pdf_document = pymupdf.open(stream=content, filetype="pdf")
-            
-            if page_number < 1 or page_number > len(pdf_document):
-                raise ValueError(f"Invalid page number: {page_number}")
-            
-            page = pdf_document[page_number - 1]  # Convert to 0-based
-            text = page.get_text()
-            pdf_document.close()
+            with self._doc_pool.open(content) as pdf_document:
+                if page_number < 1 or page_number > len(pdf_document):
+                    raise ValueError(f"Invalid page number: {page_number}")
+                
+                page = pdf_document[page_number - 1]  # Convert to 0-based
+                text = page.get_text("text", flags=_TEXT_FLAGS)
             
             return self._clean_text(text)
             
         except Exception as e:
             logger.error(f"Error extracting text from page {page_number}: {str(e)}")
-            return ""
\ No newline at end of file
+            return ""
+    
+    def close(self) -> None:
+        """Close pooled PDF documents."""
+        self._doc_pool.clear()
\ No newline at end of file
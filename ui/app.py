@@ -1,12 +1,14 @@
 import streamlit as st
 import pandas as pd
 import asyncio
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 import time
+from itertools import islice
 
 from config.connections import get_s3_client, get_supabase_client, init_logging
 from core.document_manager import DocumentManager
+from core.result_cache import ResultCache
 from models.document import Document
 from ui.components.document_list import DocumentListComponent
 from ui.components.metadata_editor import MetadataEditor
@@ -14,6 +16,100 @@ from ui.components.progress_tracker import ProgressTracker
 from ui.components.cache_manager import CacheManagerComponent
 from ui.utils import UIUtils
 
+# Statistics are served from cache for this long before the next rerun refetches them
+STATS_CACHE_TTL = 30
+
+# Documents processed at the same time by the processing loop
+PROCESSING_CONCURRENCY = 8
+
+# Upper bound on progress and session state updates during one processing run
+MAX_UI_UPDATES = 50
+UI_UPDATE_INTERVAL = 0.2
+
+# Results shown in the processing section's recent results table
+RECENT_RESULTS_LIMIT = 25
+
+# Result expanders rendered after a processing run; the full list is offered as a CSV download
+RESULTS_PAGE_SIZE = 25
+
+
+@st.cache_resource(show_spinner=False)
+def _init_logging_once() -> None:
+    """Configure logging once per server process; each call would otherwise open another log file handler"""
+    init_logging()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_document_manager() -> DocumentManager:
+    """Build the clients and document manager once per server process instead of per rerun"""
+    return DocumentManager(get_s3_client(), get_supabase_client())
+
+
+@st.cache_data(ttl=STATS_CACHE_TTL, show_spinner=False)
+def _cached_statistics(refresh_token: Optional[datetime]) -> Dict:
+    """
+    Processing statistics, shared across reruns until the TTL lapses or the user refreshes.
+    
+    Args:
+        refresh_token: Time of the last manual refresh; a new value bypasses the cached result
+        
+    Returns:
+        Statistics dictionary from the document manager
+    """
+    return _get_document_manager().get_statistics()
+
+
+# Persisted to disk so a restarted server skips the full S3 and Supabase listing; Streamlit ignores
+# TTLs on persisted caches, so the lists stay until refresh_documents clears them
+@st.cache_data(persist="disk", show_spinner=False)
+def _fetch_document_lists() -> Tuple[List[Document], List[Document]]:
+    """
+    Processed and unprocessed documents from one S3 listing, shared across reruns and restarts.
+    
+    Returns:
+        (processed, unprocessed) document lists
+    """
+    return _get_document_manager().split_documents_by_status()
+
+
+def _fetch_documents(kind: str) -> List[Document]:
+    """
+    Processed or unprocessed documents from the cached listing.
+    
+    Args:
+        kind: "processed" or "unprocessed"
+        
+    Returns:
+        List of documents of the requested kind
+    """
+    processed, unprocessed = _fetch_document_lists()
+    return processed if kind == "processed" else unprocessed
+
+
+@st.cache_data(show_spinner=False)
+def _all_documents() -> Tuple[Document, ...]:
+    """
+    Processed and unprocessed documents together, built once per refresh instead of per rerun.
+    
+    Returns:
+        Processed documents followed by unprocessed documents
+    """
+    processed, unprocessed = _fetch_document_lists()
+    return (*processed, *unprocessed)
+
+
+def _clear_document_lists() -> None:
+    """Drop the cached document lists and the combined view built from them"""
+    _fetch_document_lists.clear()
+    _all_documents.clear()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_cache_manager(cache_id: int, _cache: ResultCache) -> CacheManagerComponent:
+    """Cache management component for a result cache, keyed by the cache's identity"""
+    return CacheManagerComponent(_cache)
+
+
 class DocumentProcessorApp:
     """Main Streamlit application for document processing"""
     
@@ -23,7 +119,7 @@ class DocumentProcessorApp:
     def init_app(self):
         """Initialize the application"""
         # Initialize logging
-        init_logging()
+        _init_logging_once()
         
         # Initialize session state
         UIUtils.init_session_state()
@@ -33,9 +129,9 @@ class DocumentProcessorApp:
         
         # Initialize clients
         try:
-            self.s3_client = get_s3_client()
-            self.supabase_client = get_supabase_client()
-            self.doc_manager = DocumentManager(self.s3_client, self.supabase_client)
+            self.doc_manager = _get_document_manager()
+            self.s3_client = self.doc_manager.s3
+            self.supabase_client = self.doc_manager.supabase
         except Exception as e:
             st.error(f"Failed to initialize clients: {e}")
             st.stop()
@@ -74,14 +170,6 @@ class DocumentProcessorApp:
             # Document filters
             st.subheader("📋 Filters")
             
-            # Document type filter
-            doc_types = ["All", "manual", "diagram", "sparepartslist", "spreadsheet", "plain_document"]
-            st.session_state.filter_type = st.selectbox(
-                "Document Type",
-                doc_types,
-                index=doc_types.index(st.session_state.get('filter_type', 'All'))
-            )
-            
             # Show processed/unprocessed toggle
             show_processed = st.checkbox(
                 "Show Processed Documents",
@@ -104,7 +192,7 @@ class DocumentProcessorApp:
         st.subheader("📊 Statistics")
         
         try:
-            stats = self.doc_manager.get_statistics()
+            stats = _cached_statistics(st.session_state.get('last_refresh'))
             if stats:
                 progress = stats.get('processing_progress', {})
                 
@@ -123,17 +211,22 @@ class DocumentProcessorApp:
     
     def render_main_view(self):
         """Render main document processing view"""
-        # Create tabs for different sections
-        tab1, tab2, tab3 = st.tabs(["📄 Documents", "🗃️ Cache Management", "📊 Statistics"])
-        
-        with tab1:
-            self.render_documents_tab()
-        
-        with tab2:
-            self.render_cache_management_tab()
+        # st.tabs runs every tab body on each rerun; a radio selector lets only the visible
+        # section fetch its data
+        sections = {
+            "📄 Documents": self.render_documents_tab,
+            "🗃️ Cache Management": self.render_cache_management_tab,
+            "📊 Statistics": self.render_statistics_tab,
+        }
+        active_tab = st.radio(
+            "Section",
+            list(sections),
+            horizontal=True,
+            key="active_tab",
+            label_visibility="collapsed"
+        )
         
-        with tab3:
-            self.render_statistics_tab()
+        sections[active_tab]()
     
     def render_documents_tab(self):
         """Render the documents tab"""
@@ -152,13 +245,11 @@ class DocumentProcessorApp:
         """Render the cache management tab"""
         try:
             # Get all documents for cache management
-            all_documents = (
-                self.doc_manager.get_processed_documents() + 
-                self.doc_manager.get_unprocessed_documents()
-            )
+            all_documents = _all_documents()
             
             # Initialize cache manager
-            cache_manager = CacheManagerComponent(self.doc_manager.result_cache)
+            result_cache = self.doc_manager.result_cache
+            cache_manager = _get_cache_manager(id(result_cache), result_cache)
             
             # Render cache management interface
             cache_manager.render_full_cache_manager(all_documents)
@@ -172,7 +263,7 @@ class DocumentProcessorApp:
         
         try:
             # Get statistics
-            stats = self.doc_manager.get_statistics()
+            stats = _cached_statistics(st.session_state.get('last_refresh'))
             
             if stats:
                 # Processing progress
@@ -201,15 +292,6 @@ class DocumentProcessorApp:
                 if total > 0:
                     st.progress(processed / total, text=f"Processing Progress: {progress_pct:.1f}%")
                 
-                # Document type distribution
-                type_dist = stats.get('document_type_distribution', {})
-                if type_dist:
-                    st.subheader("📋 Document Types")
-                    type_cols = st.columns(len(type_dist))
-                    for i, (doc_type, count) in enumerate(type_dist.items()):
-                        with type_cols[i]:
-                            st.metric(doc_type.title(), count)
-                
                 # Cache statistics
                 st.subheader("📦 Cache Statistics")
                 cache_stats = self.doc_manager.result_cache.get_cache_stats()
@@ -235,18 +317,10 @@ class DocumentProcessorApp:
         """Render document list and management section"""
         # Get documents based on filters
         try:
-            if st.session_state.show_processed:
-                documents = self.doc_manager.get_processed_documents()
-                st.subheader(f"Processed Documents ({len(documents)})")
-            else:
-                documents = self.doc_manager.get_unprocessed_documents()
-                st.subheader(f"Unprocessed Documents ({len(documents)})")
+            kind = "processed" if st.session_state.show_processed else "unprocessed"
+            documents = _fetch_documents(kind)
             
-            # Filter by type
-            if st.session_state.filter_type != "All":
-                # Note: This would need document type to be stored in the Document model
-                # For now, we'll show all documents
-                pass
+            st.subheader(f"{kind.title()} Documents ({len(documents)})")
             
             # Document summary
             DocumentListComponent.render_document_summary(documents)
@@ -300,20 +374,20 @@ class DocumentProcessorApp:
         if st.button("🚀 Process Selected Documents", type="primary"):
             self.start_processing(selected_docs)
         
-        # Recent processing results
+        # Recent processing results, as one table instead of an expander per result
         if st.session_state.get('processing_results'):
             st.subheader("Recent Results")
-            results = st.session_state.processing_results[-5:]  # Last 5 results
-            
-            for result in results:
-                status_icon = "✅" if result.get('success', False) else "❌"
-                document_name = result.get('document', 'Unknown')
-                
-                with st.expander(f"{status_icon} {document_name}"):
-                    if result.get('success', False):
-                        st.success("Processing completed successfully")
-                    else:
-                        st.error(f"Error: {result.get('error', 'Unknown error')}")
+            recent = pd.DataFrame(st.session_state.processing_results[-RECENT_RESULTS_LIMIT:]).reindex(
+                columns=['document', 'success', 'processing_time', 'error']
+            )
+            recent['success'] = recent['success'].fillna(False).astype(bool)
+            st.dataframe(recent, use_container_width=True, hide_index=True)
+            
+            failed = recent[~recent['success']]
+            if not failed.empty and st.toggle("Expand failed", key="expand_failed_results"):
+                for document_name, error in zip(failed['document'], failed['error']):
+                    with st.expander(f"❌ {document_name}"):
+                        st.error(f"Error: {error if isinstance(error, str) else 'Unknown error'}")
     
     def render_processing_view(self):
         """Render active processing view"""
@@ -351,6 +425,7 @@ class DocumentProcessorApp:
                 # Clear cached documents
                 if 'documents' in st.session_state:
                     del st.session_state['documents']
+                _clear_document_lists()
                 
                 # Update timestamp
                 st.session_state.last_refresh = datetime.now()
@@ -367,12 +442,17 @@ class DocumentProcessorApp:
         try:
             selected_docs = st.session_state.get('selected_docs', [])
             
-            for doc in selected_docs:
-                if changes.get('machines'):
-                    doc['Machine Names'] = ', '.join(changes['machines'])
-                
-                if changes.get('document_type'):
-                    doc['Document Type'] = changes['document_type']
+            # Build the new column values once and apply them to every row
+            updates = {}
+            if changes.get('machines'):
+                updates['Machine Names'] = ', '.join(changes['machines'])
+            
+            if changes.get('document_type'):
+                updates['Document Type'] = changes['document_type']
+            
+            if updates:
+                for doc in selected_docs:
+                    doc.update(updates)
             
             # Update session state
             st.session_state.selected_docs = selected_docs
@@ -399,7 +479,7 @@ class DocumentProcessorApp:
             # Initialize processing state
             st.session_state.processing_active = True
             st.session_state.processing_results = []
-            st.session_state.processing_start_time = time.time()
+            st.session_state.processing_start_time = time.perf_counter()
             st.session_state.total_processing_docs = len(prepared_docs)
             
             UIUtils.add_log_entry("INFO", f"Started processing {len(prepared_docs)} documents")
@@ -414,93 +494,95 @@ class DocumentProcessorApp:
     def process_documents_real(self, documents: List[Dict]):
         """Process documents using the actual document processing pipeline"""
         try:
-            # Convert prepared documents to Document objects and metadata
-            documents_with_metadata = []
-            
-            for doc_data in documents:
-                doc_info = doc_data['document']
-                metadata = doc_data['metadata']
-                
-                # Create Document object from document info
-                document = Document(
-                    s3_key=doc_info['s3_key'],
-                    filename=doc_info['filename'],
-                    file_size=doc_info['file_size'],
-                    last_modified=datetime.now(),  # We'll use current time as placeholder
-                    etag=doc_info['etag']
-                )
-                
-                documents_with_metadata.append({
-                    'document': document,
-                    'metadata': metadata
-                })
+            # Convert prepared documents to Document objects and metadata up front, sharing one
+            # placeholder timestamp, so the processing loop only dispatches
+            now = datetime.now()
+            documents_with_metadata = [
+                {
+                    'document': Document(
+                        s3_key=doc_data['document']['s3_key'],
+                        filename=doc_data['document']['filename'],
+                        file_size=doc_data['document']['file_size'],
+                        last_modified=now,  # We'll use current time as placeholder
+                        etag=doc_data['document']['etag']
+                    ),
+                    'metadata': doc_data['metadata']
+                }
+                for doc_data in documents
+            ]
             
             # Process documents in batches for better UI responsiveness
             results = []
+            successful_count = failed_count = 0
             total_docs = len(documents_with_metadata)
             
             UIUtils.add_log_entry("INFO", f"Starting processing of {total_docs} documents")
             
-            # Create progress placeholder
-            progress_placeholder = st.empty()
+            # Progress lives in a single status container; processing runs inside this script run,
+            # so its updates only send deltas for this one element
+            status = st.status(f"Processing {total_docs} documents...", expanded=True)
+            progress_placeholder = status.empty()
             
-            for i, doc_with_metadata in enumerate(documents_with_metadata):
-                document = doc_with_metadata['document']
-                metadata = doc_with_metadata['metadata']
-                
-                # Update current document in session state
-                st.session_state.current_document = document.filename
-                
-                # Update progress
-                progress_placeholder.progress(
-                    (i + 1) / total_docs, 
-                    text=f"Processing {document.filename} ({i + 1}/{total_docs})"
-                )
-                
-                UIUtils.add_log_entry("INFO", f"Processing {document.filename}")
+            # Touch session state and the progress bar on every Nth document only, and at most every
+            # UI_UPDATE_INTERVAL seconds, so large or fast runs redraw a bounded number of times
+            update_every = max(1, total_docs // MAX_UI_UPDATES)
+            run_start = st.session_state.get('processing_start_time') or time.perf_counter()
+            last_update = 0.0
+            
+            # Documents run through a sliding window of workers; results arrive in selection order
+            processed_results = self.doc_manager.iter_process_documents(
+                documents_with_metadata, max_workers=PROCESSING_CONCURRENCY
+            )
+            
+            try:
+                for position, (item, result) in enumerate(zip(documents_with_metadata, processed_results), 1):
+                    filename = item['document'].filename
+                    processing_time = result.get('processing_time', 0)
                 
-                # Process the document
-                start_time = time.time()
-                try:
-                    UIUtils.add_log_entry("INFO", f"Starting document processing for {document.filename}")
-                    result = self.doc_manager.process_document(document, metadata)
-                    processing_time = time.time() - start_time
-                    UIUtils.add_log_entry("INFO", f"Document processing completed for {document.filename} in {processing_time:.1f}s")
-                    
                     if result['success']:
-                        UIUtils.add_log_entry("SUCCESS", f"Successfully processed {document.filename}")
+                        successful_count += 1
+                        UIUtils.add_log_entry("SUCCESS", f"Successfully processed {filename} in {processing_time:.1f}s")
                         results.append({
                             'success': True,
-                            'document': document.filename,
+                            'document': filename,
                             'processing_time': processing_time,
                             'processor_used': result.get('processor_used', 'Unknown'),
                             'webhook_result': result.get('webhook_result')
                         })
                     else:
-                        UIUtils.add_log_entry("ERROR", f"Failed to process {document.filename}: {result.get('error', 'Unknown error')}")
+                        failed_count += 1
+                        UIUtils.add_log_entry("ERROR", f"Failed to process {filename}: {result.get('error', 'Unknown error')}")
                         results.append({
                             'success': False,
-                            'document': document.filename,
+                            'document': filename,
                             'processing_time': processing_time,
                             'error': result.get('error', 'Unknown error')
                         })
-                        
-                except Exception as e:
-                    processing_time = time.time() - start_time
-                    error_msg = f"Exception processing {document.filename}: {str(e)}"
-                    UIUtils.add_log_entry("ERROR", error_msg)
-                    results.append({
-                        'success': False,
-                        'document': document.filename,
-                        'processing_time': processing_time,
-                        'error': str(e)
-                    })
                 
-                # Update session state with current results
-                st.session_state.processing_results = results
+                    elapsed = time.perf_counter() - run_start
+                    if position % update_every == 0 and elapsed - last_update >= UI_UPDATE_INTERVAL:
+                        last_update = elapsed
+                        eta = elapsed / position * (total_docs - position)
+                    
+                        # Update current document in session state
+                        st.session_state.current_document = filename
+                    
+                        # Update progress
+                        progress_placeholder.progress(
+                            position / total_docs,
+                            text=f"Processed {filename} ({position}/{total_docs}, about {eta:.0f}s left)"
+                        )
+                        st.session_state.processing_results = list(results)
+            finally:
+                # Clicking Cancel (or any widget) reruns the app, which interrupts this loop mid-run;
+                # closing the window here is what stops new documents, in-flight ones finish in the background
+                processed_results.close()
                 
-                # Brief pause to allow UI updates
-                time.sleep(0.1)
+                # Processed documents change which list they belong to; the persisted lists never
+                # expire on their own, so drop them rather than keep showing these as unprocessed
+                _clear_document_lists()
+            
+            st.session_state.processing_results = results
             
             # Processing complete
             st.session_state.processing_active = False
@@ -508,11 +590,9 @@ class DocumentProcessorApp:
             
             # Clear progress placeholder
             progress_placeholder.empty()
+            status.update(label=f"Processed {total_docs} documents", state="complete", expanded=False)
             
-            # Show completion summary
-            successful_count = sum(1 for r in results if r['success'])
-            failed_count = len(results) - successful_count
-            
+            # Show completion summary from the counts tallied in the loop
             UIUtils.add_log_entry("INFO", f"Processing complete! {successful_count} successful, {failed_count} failed")
             
             if failed_count == 0:
@@ -522,7 +602,21 @@ class DocumentProcessorApp:
             
             # Show detailed results
             st.subheader("Processing Results")
-            for result in results:
+            
+            # One expander per result gets slow for large runs; show the first page and offer the rest as CSV
+            if len(results) > RESULTS_PAGE_SIZE:
+                st.caption(f"Showing the first {RESULTS_PAGE_SIZE} of {len(results)} results")
+                results_csv = pd.DataFrame(results).reindex(
+                    columns=['document', 'success', 'processing_time', 'processor_used', 'error']
+                ).to_csv(index=False)
+                st.download_button(
+                    "⬇️ Download all results as CSV",
+                    results_csv,
+                    file_name="processing_results.csv",
+                    mime="text/csv"
+                )
+            
+            for result in islice(results, RESULTS_PAGE_SIZE):
                 status_icon = "✅" if result['success'] else "❌"
                 with st.expander(f"{status_icon} {result['document']}"):
                     if result['success']:
@@ -564,7 +658,6 @@ class DocumentProcessorApp:
     def cancel_processing(self):
         """Cancel active processing"""
         st.session_state.processing_active = False
-        st.session_state.processing_cancelled = True
         
         UIUtils.add_log_entry("WARNING", "Processing cancelled by user")
         st.warning("Processing cancelled")
@@ -573,7 +666,7 @@ class DocumentProcessorApp:
         """Get elapsed processing time"""
         start_time = st.session_state.get('processing_start_time')
         if start_time:
-            return time.time() - start_time
+            return time.perf_counter() - start_time
         return None
 
 def main():
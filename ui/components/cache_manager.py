@@ -3,12 +3,42 @@ Cache management component for the document processor UI.
 """
 
 import streamlit as st
-from typing import List, Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 from models.document import Document
 from core.result_cache import ResultCache
 import pandas as pd
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_cache_status_df(document_keys: Tuple[Tuple[str, str, int], ...], cache_version: int,
+                           _documents: Sequence[Document], _cache: ResultCache) -> pd.DataFrame:
+    """
+    Build the document cache status table.
+    
+    Args:
+        document_keys: (etag, filename, file_size) per document; part of the cache key
+        cache_version: ResultCache.version, so cache changes rebuild the table
+        _documents: Documents matching document_keys (not hashed)
+        _cache: Result cache to read statuses from (not hashed)
+        
+    Returns:
+        Cache status DataFrame
+    """
+    # One pass over the cache up front, then a dict lookup per document
+    cached_success = _cache.snapshot_by_etag()
+    status_labels = {None: "No cache", True: "✅ Success", False: "❌ Failed"}
+    
+    # Build the frame column by column rather than from a dict per row
+    return pd.DataFrame({
+        'Filename': [filename for _, filename, _ in document_keys],
+        'Cache Status': [status_labels[cached_success.get(etag)] for etag, _, _ in document_keys],
+        'Size (MB)': pd.Series([file_size for _, _, file_size in document_keys], dtype='float64').div(1024 * 1024).round(2),
+        'Clear Cache': False,
+        'doc_obj': list(_documents),
+        'doc_etag': [etag for etag, _, _ in document_keys]  # Store etag for cache operations
+    })
+
+
 class CacheManagerComponent:
     """Component for managing document processing cache"""
     
@@ -72,37 +102,18 @@ class CacheManagerComponent:
                     st.session_state.confirm_clear_all = True
                     st.warning("Click again to confirm clearing all cache")
     
-    def render_document_cache_manager(self, documents: List[Document]) -> None:
+    # Fragments rerun on their own, so ticking checkboxes here leaves the rest of the page alone
+    @st.experimental_fragment
+    def render_document_cache_manager(self, documents: Sequence[Document]) -> None:
         """Render document-specific cache management"""
         if not documents:
             return
         
         st.subheader("🗂️ Document Cache Management")
         
-        # Create DataFrame for cache status
-        cache_data = []
-        for doc in documents:
-            # Check if document has cached results
-            has_cache, success = self._has_cached_result(doc)
-            
-            cache_info = "No cache"
-            if has_cache:
-                cache_info = "✅ Success" if success else "❌ Failed"
-            
-            cache_data.append({
-                'Filename': doc.filename,
-                'Cache Status': cache_info,
-                'Size (MB)': round(doc.file_size / (1024 * 1024), 2),
-                'Clear Cache': False,
-                'doc_obj': doc,
-                'doc_etag': doc.etag  # Store etag for cache operations
-            })
-        
-        if not cache_data:
-            st.info("No documents available for cache management")
-            return
-        
-        df = pd.DataFrame(cache_data)
+        # Create DataFrame for cache status; reruns with the same documents and cache contents reuse it
+        document_keys = tuple((doc.etag, doc.filename, doc.file_size) for doc in documents)
+        df = _build_cache_status_df(document_keys, self.cache.version, documents, self.cache)
         
         # Configure columns
         column_config = {
@@ -155,15 +166,14 @@ class CacheManagerComponent:
             disabled=["doc_obj", "doc_etag"]
         )
         
-        # Process clear cache selections
-        to_clear = edited_df[edited_df['Clear Cache']].to_dict('records')
+        # Process clear cache selections, reading only the two columns needed from the selected rows
+        selected = edited_df['Clear Cache'].to_numpy(dtype=bool)
+        to_clear = list(zip(edited_df.loc[selected, 'Filename'], edited_df.loc[selected, 'doc_etag']))
         
         if to_clear:
             if st.button(f"Clear Cache for {len(to_clear)} Selected Documents", type="primary"):
                 cleared_count = 0
-                for item in to_clear:
-                    filename = item['Filename']
-                    doc_etag = item['doc_etag']
+                for filename, doc_etag in to_clear:
                     try:
                         # Clear cache by etag
                         self._clear_cache_by_etag(doc_etag)
@@ -174,65 +184,46 @@ class CacheManagerComponent:
                 st.success(f"Cleared cache for {cleared_count} documents")
                 st.rerun()
     
-    def _get_cache_key_for_doc(self, document: Document) -> str:
-        """Get cache key for a document (simplified version)"""
-        # This is a simplified version - in reality we'd need the metadata
-        # For now, we'll check all cache entries for this document's etag
-        for cache_key, entry in self.cache._memory_cache.items():
-            if entry.document_etag == document.etag:
-                return cache_key
-        return ""
-    
-    def _has_cached_result(self, document: Document) -> tuple[bool, bool]:
-        """Check if document has cached result and if it was successful"""
-        for cache_key, entry in self.cache._memory_cache.items():
-            if entry.document_etag == document.etag:
-                processing_info = entry.processing_result.get('processing_info', {})
-                success = processing_info.get('success', False)
-                return True, success
-        return False, False
-    
     def _clear_cache_by_etag(self, etag: str) -> None:
         """Clear cache entries by document etag"""
-        keys_to_remove = []
-        for cache_key, entry in self.cache._memory_cache.items():
-            if entry.document_etag == etag:
-                keys_to_remove.append(cache_key)
-        
-        for cache_key in keys_to_remove:
-            self.cache._invalidate_entry(cache_key)
+        self.cache.invalidate_etag(etag)
     
+    @st.experimental_fragment
     def render_cache_details(self) -> None:
         """Render detailed cache information"""
         if st.checkbox("Show Cache Details"):
             st.subheader("🔍 Cache Details")
             
             try:
-                # Get cache entries
-                entries = []
-                for cache_key, entry in self.cache._memory_cache.items():
-                    processing_info = entry.processing_result.get('processing_info', {})
-                    
-                    entries.append({
-                        'Cache Key': cache_key[:16] + "...",
-                        'Filename': entry.filename,
-                        'Document Type': entry.document_type,
-                        'Success': "✅" if processing_info.get('success', False) else "❌",
-                        'Processor': processing_info.get('processor', 'Unknown'),
-                        'Created': entry.created_at.strftime('%Y-%m-%d %H:%M:%S'),
-                        'Size (MB)': round(entry.file_size / (1024 * 1024), 2)
-                    })
+                # Get cache entries as columns in one pass; dates and success stay typed values and are
+                # formatted by the column config instead of per-row strings
+                items = self.cache._entry_items()
                 
-                if entries:
-                    df = pd.DataFrame(entries)
-                    st.dataframe(df, use_container_width=True)
+                if items:
+                    df = pd.DataFrame({
+                        'Cache Key': [cache_key[:16] + "..." for cache_key, _ in items],
+                        'Filename': [entry.filename for _, entry in items],
+                        'Document Type': [entry.document_type for _, entry in items],
+                        'Success': [entry.success for _, entry in items],
+                        'Processor': [entry.processor for _, entry in items],
+                        'Created': [entry.created_at for _, entry in items],
+                        'Size (MB)': pd.Series([entry.file_size for _, entry in items], dtype='float64').div(1024 * 1024).round(2)
+                    })
+                    st.dataframe(
+                        df,
+                        use_container_width=True,
+                        column_config={
+                            "Success": st.column_config.CheckboxColumn("Success", disabled=True),
+                            "Created": st.column_config.DatetimeColumn("Created", format="YYYY-MM-DD HH:mm:ss")
+                        }
+                    )
                 else:
                     st.info("No cache entries found")
             
             except Exception as e:
                 st.error(f"Error loading cache details: {e}")
     
-    def render_full_cache_manager(self, documents: List[Document]) -> None:
+    def render_full_cache_manager(self, documents: Sequence[Document]) -> None:
         """Render the complete cache management interface"""
         st.header("🗃️ Cache Management")
         
@@ -2,6 +2,10 @@ import streamlit as st
 import pandas as pd
 from typing import List, Dict, Optional
 from models.document import Document
+from collections import Counter
+
+# File types shown as separate columns in the document summary
+MAX_FILE_TYPE_COLUMNS = 5
 
 class DocumentListComponent:
     """Component for displaying and editing document lists"""
@@ -16,24 +20,20 @@ class DocumentListComponent:
             st.info("No documents found. Click 'Refresh Document List' to load documents.")
             return []
         
-        # Convert documents to DataFrame
-        df_data = []
-        for doc in documents:
-            df_data.append({
-                'Select': False,
-                'Filename': doc.filename,
-                'Size (MB)': round(doc.file_size / (1024 * 1024), 2),
-                'Last Modified': doc.last_modified,
-                'Machine Names': '',
-                'Document Type': 'manual',
-                'Processing Method': 'markdown',
-                'Status': doc.processing_status,
-                's3_key': doc.s3_key,
-                'file_id': doc.file_id,
-                'etag': doc.etag
-            })
-        
-        df = pd.DataFrame(df_data)
+        # Convert documents to DataFrame, one column list at a time rather than a dict per row
+        df = pd.DataFrame({
+            'Select': False,
+            'Filename': [doc.filename for doc in documents],
+            'Size (MB)': pd.Series([doc.file_size for doc in documents], dtype='float64').div(1024 * 1024).round(2),
+            'Last Modified': [doc.last_modified for doc in documents],
+            'Machine Names': '',
+            'Document Type': 'manual',
+            'Processing Method': 'markdown',
+            'Status': [doc.processing_status for doc in documents],
+            's3_key': [doc.s3_key for doc in documents],
+            'file_id': [doc.file_id for doc in documents],
+            'etag': [doc.etag for doc in documents]
+        })
         
         # Configure column display
         column_config = {
@@ -114,8 +114,9 @@ class DocumentListComponent:
             column_order=["Select", "Filename", "Size (MB)", "Last Modified", "Machine Names", "Document Type", "Processing Method", "Status"]
         )
         
-        # Return selected documents
-        selected_docs = edited_df[edited_df['Select']].to_dict('records')
+        # Return selected documents; only the selected rows are turned into dicts for downstream use
+        selected = edited_df['Select'].to_numpy(dtype=bool)
+        selected_docs = edited_df.loc[selected].to_dict('records')
         return selected_docs
     
     @staticmethod
@@ -129,11 +130,11 @@ class DocumentListComponent:
         total_size = sum(doc.file_size for doc in documents)
         total_size_mb = total_size / (1024 * 1024)
         
-        # File type distribution
-        file_types = {}
-        for doc in documents:
-            ext = doc.filename.split('.')[-1].lower() if '.' in doc.filename else 'unknown'
-            file_types[ext] = file_types.get(ext, 0) + 1
+        # File type distribution, counted by Counter in one pass and ordered most common first
+        file_types = Counter(
+            doc.filename.rpartition('.')[2].lower() if '.' in doc.filename else 'unknown'
+            for doc in documents
+        )
         
         # Display metrics
         col1, col2, col3 = st.columns(3)
@@ -147,14 +148,16 @@ class DocumentListComponent:
         with col3:
             # Show most common file type
             if file_types:
-                most_common = max(file_types.items(), key=lambda x: x[1])
+                most_common = file_types.most_common(1)[0]
                 st.metric("Most Common Type", f".{most_common[0]} ({most_common[1]})")
         
         # File type breakdown
         if file_types:
             st.write("**File Types:**")
-            type_cols = st.columns(len(file_types))
-            for i, (ext, count) in enumerate(file_types.items()):
+            # Only the most common types get a column, so many distinct extensions don't create many columns
+            top_types = file_types.most_common(MAX_FILE_TYPE_COLUMNS)
+            type_cols = st.columns(len(top_types))
+            for i, (ext, count) in enumerate(top_types):
                 with type_cols[i]:
                     st.write(f"`.{ext}`: {count}")
     
@@ -60,7 +60,8 @@ class ProcessingQueueDashboard:
         
         # Progress bar
         if queue_status['total_tasks'] > 0:
-            progress = (queue_status['completed_tasks'] + queue_status['failed_tasks']) / queue_status['total_tasks']
+            finished = queue_status['completed_tasks'] + queue_status['failed_tasks'] + queue_status['cancelled_tasks']
+            progress = finished / queue_status['total_tasks']
             st.progress(progress, text=f"Overall Progress: {progress:.1%}")
         
         # Queue status indicators
@@ -228,10 +229,10 @@ class ProcessingQueueDashboard:
                 controls['stop'] = st.button("⏹️ Stop", help="Stop processing queue")
         
         with col3:
-            if queue_status['completed_tasks'] > 0 or queue_status['failed_tasks'] > 0:
+            if queue_status['completed_tasks'] > 0 or queue_status['failed_tasks'] > 0 or queue_status['cancelled_tasks'] > 0:
                 controls['clear_completed'] = st.button(
                     "🗑️ Clear Completed",
-                    help="Clear completed and failed tasks from memory"
+                    help="Clear completed, failed and cancelled tasks from memory"
                 )
         
         with col4:
@@ -1,6 +1,7 @@
 import streamlit as st
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from datetime import datetime
+from itertools import islice
 import time
 
 class ProgressTracker:
@@ -140,7 +141,7 @@ class ProgressTracker:
             )
     
     @staticmethod
-    def render_real_time_log(log_entries: List[Dict], max_entries: int = 10) -> None:
+    def render_real_time_log(log_entries: Sequence[Dict], max_entries: int = 10) -> None:
         """Render real-time processing log"""
         st.subheader("Processing Log")
         
@@ -153,7 +154,7 @@ class ProgressTracker:
         
         with log_container:
             # Show recent entries (newest first)
-            for entry in log_entries[-max_entries:]:
+            for entry in islice(log_entries, max(0, len(log_entries) - max_entries), None):
                 timestamp = entry.get('timestamp', datetime.now())
                 level = entry.get('level', 'INFO')
                 message = entry.get('message', '')
@@ -186,7 +187,6 @@ class ProgressTracker:
             
             with col2:
                 if st.button("⏹️ Cancel Processing", type="secondary"):
-                    st.session_state.processing_cancelled = True
                     return True
         
         return False
@@ -238,9 +238,6 @@ class ProgressTracker:
         if 'processing_paused' not in st.session_state:
             st.session_state.processing_paused = False
         
-        if 'processing_cancelled' not in st.session_state:
-            st.session_state.processing_cancelled = False
-        
         if 'batch_results' not in st.session_state:
             st.session_state.batch_results = []
         
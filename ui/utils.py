@@ -1,8 +1,13 @@
 import streamlit as st
 from typing import Dict, List, Optional
 from datetime import datetime
+from collections import deque
+import base64
 import time
 
+# Processing log entries kept in session state; older entries drop off as new ones arrive
+MAX_LOG_ENTRIES = 100
+
 class UIUtils:
     """Utility functions for the Streamlit UI"""
     
@@ -15,9 +20,8 @@ class UIUtils:
             'processing_status': {},
             'processing_active': False,
             'processing_results': [],
-            'processing_log': [],
+            'processing_log': deque(maxlen=MAX_LOG_ENTRIES),
             'last_refresh': None,
-            'filter_type': 'All',
             'show_processed': False,
             'recent_metadata': []
         }
@@ -29,8 +33,8 @@ class UIUtils:
     @staticmethod
     def add_log_entry(level: str, message: str):
         """Add entry to processing log"""
-        if 'processing_log' not in st.session_state:
-            st.session_state.processing_log = []
+        if not isinstance(st.session_state.get('processing_log'), deque):
+            st.session_state.processing_log = deque(st.session_state.get('processing_log') or (), maxlen=MAX_LOG_ENTRIES)
         
         entry = {
             'timestamp': datetime.now(),
@@ -38,11 +42,8 @@ class UIUtils:
             'message': message
         }
         
+        # The bounded deque drops the oldest entry instead of re-slicing the whole log
         st.session_state.processing_log.append(entry)
-        
-        # Keep only last 100 entries
-        if len(st.session_state.processing_log) > 100:
-            st.session_state.processing_log = st.session_state.processing_log[-100:]
     
     @staticmethod
     def save_recent_metadata(metadata: Dict):
@@ -122,7 +123,6 @@ class UIUtils:
     @staticmethod
     def create_download_link(content: str, filename: str, mime_type: str = "text/plain") -> str:
         """Create a download link for content"""
-        import base64
         b64 = base64.b64encode(content.encode()).decode()
         href = f'<a href="data:{mime_type};base64,{b64}" download="{filename}">Download {filename}</a>'
         return href
@@ -6,7 +6,7 @@ that can be processed by APIs with file size limits.
 import PyPDF2
 import io
 import logging
-from typing import List, Dict, Any, Tuple
+from typing import Iterable, List, Dict, Any, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
@@ -64,10 +64,9 @@ class PDFChunker:
                 temp_pdf.add_page(page)
                 
                 # Get page size
-                temp_buffer = io.BytesIO()
-                temp_pdf.write(temp_buffer)
-                page_size = temp_buffer.tell()
-                temp_buffer.close()
+                with io.BytesIO() as temp_buffer:
+                    temp_pdf.write(temp_buffer)
+                    page_size = temp_buffer.tell()
                 
                 # Check if adding this page would exceed limit
                 if current_chunk_size + page_size > self.max_chunk_size_bytes and current_chunk_pages:
@@ -119,10 +118,9 @@ class PDFChunker:
             pdf_writer.add_page(page)
         
         # Write to bytes
-        buffer = io.BytesIO()
-        pdf_writer.write(buffer)
-        chunk_content = buffer.getvalue()
-        buffer.close()
+        with io.BytesIO() as buffer:
+            pdf_writer.write(buffer)
+            chunk_content = buffer.getvalue()
         
         # Create chunk info
         chunk_id = f"{filename}_chunk_{chunk_number}"
@@ -177,51 +175,53 @@ class ChunkProcessor:
     """Utility for processing chunked results and combining them"""
     
     @staticmethod
-    def combine_chunk_results(chunk_results: List[Dict[str, Any]], original_filename: str, max_expected_pages: int = None) -> Dict[str, Any]:
+    def combine_chunk_results(chunk_results: Iterable[Dict[str, Any]], original_filename: str, max_expected_pages: int = None) -> Dict[str, Any]:
         """
         Combine results from multiple chunks into a single result.
+        Results are consumed in one pass, so a generator lets each chunk result be released once merged.
         
         Args:
-            chunk_results: List of processing results from individual chunks
+            chunk_results: Processing results from individual chunks, in chunk order
             original_filename: Original document filename
             max_expected_pages: Maximum expected pages (for validation)
             
         Returns:
             Combined processing result
         """
-        if not chunk_results:
-            return {
-                'pages': [],
-                'document_metadata': {
-                    'filename': original_filename,
-                    'processing_method': 'chunked',
-                    'total_chunks': 0
-                },
-                'processing_info': {
-                    'success': False,
-                    'error': 'No chunk results provided',
-                    'processor': 'chunked'
-                }
-            }
-        
         # Combine all pages from all chunks
         combined_pages = []
         current_page_number = 1
         
+        total_chunks = 0
         successful_chunks = 0
         failed_chunks = 0
         errors = []
+        error_details = []
+        document_type = 'unknown'
+        
+        # Reuse the per-chunk totals computed while parsing instead of recounting page text
+        total_characters = 0
+        total_words = 0
+        pages_with_content = 0
+        max_page_num = 0
         
         # Track original page numbers to detect duplicates or gaps
         page_numbers_seen = set()
         
         for i, chunk_result in enumerate(chunk_results):
+            total_chunks += 1
+            if i == 0:
+                document_type = chunk_result.get('document_metadata', {}).get('document_type', 'unknown')
+            
             processing_info = chunk_result.get('processing_info', {})
             
             if processing_info.get('success', False):
                 successful_chunks += 1
                 chunk_pages = chunk_result.get('pages', [])
                 chunk_info = chunk_result.get('chunk_info', {})
+                chunk_metadata = chunk_result.get('document_metadata', {})
+                total_characters += chunk_metadata.get('total_characters', 0)
+                total_words += chunk_metadata.get('total_words', 0)
                 
                 # Get original page range for this chunk
                 original_start_page = chunk_info.get('start_page', current_page_number)
@@ -260,6 +260,10 @@ class ChunkProcessor:
                         'chunk_page_number': j + 1,  # Page number within this chunk
                         'original_page_number': original_page_num  # Page number in original document
                     }
+                    
+                    if page.get('text', '').strip():
+                        pages_with_content += 1
+                    max_page_num = max(max_page_num, original_page_num)
                 
                 combined_pages.extend(chunk_pages)
                 current_page_number += len(chunk_pages)
@@ -274,6 +278,27 @@ class ChunkProcessor:
                     start_page = chunk_info.get('start_page', current_page_number)
                     end_page = chunk_info.get('end_page', current_page_number)
                     current_page_number = end_page + 1
+                
+                # Keep the failure details now; the chunk result is not revisited
+                error_type = processing_info.get('error_type', 'Unknown')
+                chunk_details = processing_info.get('chunk_details', {})
+                page_range = chunk_details.get('page_range', f"chunk {i+1}")
+                error_details.append(f"Chunk {i+1} (pages {page_range}): {error_type} - {processing_info.get('error', 'Unknown error')}")
+        
+        if not total_chunks:
+            return {
+                'pages': [],
+                'document_metadata': {
+                    'filename': original_filename,
+                    'processing_method': 'chunked',
+                    'total_chunks': 0
+                },
+                'processing_info': {
+                    'success': False,
+                    'error': 'No chunk results provided',
+                    'processor': 'chunked'
+                }
+            }
         
         # Create combined result
         overall_success = successful_chunks > 0 and failed_chunks == 0
@@ -283,18 +308,20 @@ class ChunkProcessor:
             'document_metadata': {
                 'filename': original_filename,
                 'processing_method': 'chunked',
-                'total_chunks': len(chunk_results),
+                'total_chunks': total_chunks,
                 'successful_chunks': successful_chunks,
                 'failed_chunks': failed_chunks,
-                'document_type': chunk_results[0].get('document_metadata', {}).get('document_type', 'unknown') if chunk_results else 'unknown'
+                'total_characters': total_characters,
+                'total_words': total_words,
+                'document_type': document_type
             },
             'processing_info': {
                 'success': overall_success,
                 'processor': 'chunked',
                 'total_pages': len(combined_pages),
                 'pages_processed': len(combined_pages),
-                'pages_with_content': len([p for p in combined_pages if p.get('text', '').strip()]),
-                'chunks_processed': len(chunk_results),
+                'pages_with_content': pages_with_content,
+                'chunks_processed': total_chunks,
                 'successful_chunks': successful_chunks,
                 'failed_chunks': failed_chunks,
                 'errors': errors if errors else None
@@ -304,7 +331,6 @@ class ChunkProcessor:
         # Validate final page count
         if max_expected_pages:
             final_page_count = len(combined_pages)
-            max_page_num = max([p.get('page_number', 0) for p in combined_pages]) if combined_pages else 0
             
             if max_page_num > max_expected_pages:
                 logger.warning(f"Final result has page numbers up to {max_page_num}, but PDF only has {max_expected_pages} pages")
@@ -315,17 +341,6 @@ class ChunkProcessor:
                 combined_result['processing_info']['page_count_warning'] = f"Page count exceeds expected: {final_page_count} > {max_expected_pages}"
         
         if not overall_success:
-            error_details = []
-            for i, chunk_result in enumerate(chunk_results):
-                processing_info = chunk_result.get('processing_info', {})
-                if not processing_info.get('success', False):
-                    chunk_info = chunk_result.get('chunk_info', {})
-                    error_msg = processing_info.get('error', 'Unknown error')
-                    error_type = processing_info.get('error_type', 'Unknown')
-                    chunk_details = processing_info.get('chunk_details', {})
-                    page_range = chunk_details.get('page_range', f"chunk {i+1}")
-                    error_details.append(f"Chunk {i+1} (pages {page_range}): {error_type} - {error_msg}")
-            
-            combined_result['processing_info']['error'] = f"Processing failed: {failed_chunks} of {len(chunk_results)} chunks failed. Details: {'; '.join(error_details)}"
+            combined_result['processing_info']['error'] = f"Processing failed: {failed_chunks} of {total_chunks} chunks failed. Details: {'; '.join(error_details)}"
         
         return combined_result
\ No newline at end of file
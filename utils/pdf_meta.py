@@ -0,0 +1,48 @@
+"""
+Lightweight PDF metadata probes that avoid a full pure-Python parse.
+"""
+
+import pymupdf
+
+try:
+    import pypdfium2
+except ImportError:  # optional, faster native backend
+    pypdfium2 = None
+
+
+def page_count(content: bytes) -> int:
+    """
+    Count the pages of a PDF using a native backend.
+
+    Args:
+        content: PDF content as bytes
+
+    Returns:
+        Number of pages in the document
+    """
+    if pypdfium2 is not None:
+        pdf = pypdfium2.PdfDocument(content)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    with pymupdf.open(stream=content, filetype="pdf") as pdf:
+        return pdf.page_count
+
+
+def has_text_layer(content: bytes, min_chars: int = 100) -> bool:
+    """
+    Check whether a PDF is born-digital by probing the text layer of its first page.
+
+    Args:
+        content: PDF content as bytes
+        min_chars: Extracted characters needed to treat the page as born-digital
+
+    Returns:
+        True if the first page carries enough extractable text
+    """
+    with pymupdf.open(stream=content, filetype="pdf") as pdf:
+        if pdf.page_count == 0:
+            return False
+        return len(pdf[0].get_text().strip()) >= min_chars
@@ -0,0 +1,118 @@
+"""
+Waiter utilities for polling long-running remote jobs.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Callable, Optional
+
+
+# Maps a zero-based attempt number to a delay in seconds
+DelayStrategy = Callable[[int], float]
+
+
+def exponential_backoff(initial: float, maximum: float, base: float = 2.0, jitter: float = 0.0) -> DelayStrategy:
+    """
+    Build a capped exponential delay strategy.
+
+    Args:
+        initial: Delay for the first attempt
+        maximum: Upper bound on any delay
+        base: Growth factor per attempt
+        jitter: Fractional +/- randomization applied to each delay
+
+    Returns:
+        Delay strategy
+    """
+    def delay(attempt: int) -> float:
+        value = min(maximum, initial * (base ** attempt))
+        if jitter:
+            value *= random.uniform(1 - jitter, 1 + jitter)
+        return value
+
+    return delay
+
+
+class Waiter:
+    """Tracks a monotonic deadline and hands out poll delays from pluggable strategies"""
+
+    def __init__(self, timeout: float, strategy: DelayStrategy, error_strategy: Optional[DelayStrategy] = None):
+        self.timeout = timeout
+        self.started = time.monotonic()
+        self.deadline = self.started + timeout
+        self.strategy = strategy
+        self.error_strategy = error_strategy or strategy
+        self.attempt = 0
+        self.error_attempt = 0
+        self._last_state: Any = None
+
+    def expired(self) -> bool:
+        """Check whether the deadline has passed"""
+        return time.monotonic() >= self.deadline
+
+    def elapsed(self) -> float:
+        """Seconds since the waiter was created"""
+        return time.monotonic() - self.started
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative"""
+        return max(0.0, self.deadline - time.monotonic())
+
+    def observe(self, state: Any) -> None:
+        """
+        Record a successful check; the backoff starts over when the state changes.
+
+        Args:
+            state: Status reported by the remote job
+        """
+        if self._last_state is not None and state != self._last_state:
+            self.attempt = 0
+        self._last_state = state
+        self.error_attempt = 0
+
+    def record_error(self) -> int:
+        """
+        Record a failed check.
+
+        Returns:
+            Number of consecutive failures so far
+        """
+        self.error_attempt += 1
+        return self.error_attempt
+
+    def next_delay(self, hint: Optional[float] = None) -> float:
+        """
+        Next poll delay, capped so it never runs past the deadline.
+
+        Args:
+            hint: Delay suggested by the remote job (e.g. its ETA); used instead of the strategy
+
+        Returns:
+            Seconds to wait
+        """
+        if hint is not None:
+            return min(hint, self.remaining())
+        delay = min(self.strategy(self.attempt), self.remaining())
+        self.attempt += 1
+        return delay
+
+    def next_error_delay(self) -> float:
+        """Delay before retrying after a failed check, capped at the deadline"""
+        return min(self.error_strategy(max(0, self.error_attempt - 1)), self.remaining())
+
+    def sleep(self, hint: Optional[float] = None) -> None:
+        """Block until the next poll"""
+        time.sleep(self.next_delay(hint))
+
+    def sleep_after_error(self) -> None:
+        """Block until the retry after a failed check"""
+        time.sleep(self.next_error_delay())
+
+    async def sleep_async(self, hint: Optional[float] = None) -> None:
+        """Wait for the next poll without blocking the event loop"""
+        await asyncio.sleep(self.next_delay(hint))
+
+    async def sleep_after_error_async(self) -> None:
+        """Wait for the retry after a failed check without blocking the event loop"""
+        await asyncio.sleep(self.next_error_delay())